@@ -1,52 +1,111 @@
 import asyncio
 import os
+import time
 from playwright.async_api import async_playwright
 
 from data.region_tracker import get_url, setup_region
 from missions.buildings import gather_building_data
 from utils.tasks import grab_tasks
-from setup.login_manager import BrowserPool, login_single
+from setup.autoscaler import ContextAutoscaler
+from setup.login_manager import BrowserPool, SessionManager
+from setup.tab_workers import split_into_tabs
+from setup.resource_blocking import get_resource_blocker
 from data.config_settings import (
     get_username,
     get_password,
     get_threads,
     get_headless,
+    get_browser_scaling,
+    get_shared_context,
+    get_shared_browsers,
     get_mission_delay,
     get_other_delay,
     get_concurrent_missions,
     get_auto_tasks,
-    get_dispatch_type
+    get_dispatch_type,
+    get_pipeline_dispatch,
+    get_pipeline_queue_size,
+    delays_are_dynamic,
+    get_dynamic_delay_missions_enabled,
+    get_dynamic_delay_transport_enabled,
+    get_minimum_delay,
+    get_maximum_delay,
+    get_backoff_factor
 )
-from dispatching import navigate_and_dispatch
+from dispatching import grab_and_dispatch_pipelined, navigate_and_dispatch
+from data.cache import VEHICLE_LOCKS
+from data.mission_store import MISSION_STORE
 from missions import check_and_grab_missions
+from utils.actions import ACTION_STATS
+from utils.metrics import METRICS, metrics_logic
+from utils.polling import AdaptiveDelay
+from utils.readiness import WAIT_STATS
 from utils.pretty_print import display_info, display_error
 from utils.transport import handle_transport_requests
 from utils.vehicle_data import gather_vehicle_data
+from utils.vehicle_refresh import vehicle_refresh_logic
 
-async def other_logic(context, url):
+def make_delay(name, base, dynamic):
+    return AdaptiveDelay(
+        name,
+        base,
+        get_minimum_delay(),
+        get_maximum_delay(),
+        get_backoff_factor(),
+        delays_are_dynamic() and dynamic,
+    )
+
+
+async def other_logic(context, url, session):
     display_info("Starting transportation logic.")
+    delay = make_delay("transport", get_other_delay(), get_dynamic_delay_transport_enabled())
     while True:
         try:
-            await handle_transport_requests(context, url)
+            await session.ensure_session()
+            pending = await handle_transport_requests(context, url)
             if get_auto_tasks():
                 await grab_tasks(context, url)
-            await asyncio.sleep(get_other_delay())
+            await asyncio.sleep(delay.schedule(pending))
         except Exception as e:
             display_error(f"Error in transport logic: {e}")
 
 
-async def mission_logic(grabbing_contexts, dispatch_contexts, url):
+async def mission_logic(grabbing_contexts, dispatch_contexts, url, session, autoscaler=None):
+    # Both context lists may be resized in place by the autoscaler between cycles.
     display_info("Starting mission logic.")
+    delay = make_delay("mission", get_mission_delay(), get_dynamic_delay_missions_enabled())
+    leftover = set()
     while True:
         try:
+            await session.ensure_session()
             if not os.path.exists("data/vehicle_data.json"):
                 await gather_vehicle_data(grabbing_contexts, len(grabbing_contexts), url)
             if not os.path.exists("data/building_data.json"):
                 await gather_building_data(grabbing_contexts, len(grabbing_contexts), url)
 
-            await check_and_grab_missions(grabbing_contexts, len(grabbing_contexts), url)
-            await navigate_and_dispatch(dispatch_contexts, url)
-            await asyncio.sleep(get_mission_delay())
+            start = time.perf_counter()
+            if get_pipeline_dispatch():
+                stats = await grab_and_dispatch_pipelined(grabbing_contexts, dispatch_contexts, url, get_pipeline_queue_size())
+            else:
+                await check_and_grab_missions(grabbing_contexts, len(grabbing_contexts), url)
+                stats = await navigate_and_dispatch(dispatch_contexts, url)
+            # Only missions newly left undispatched are backlog. One that was already left over last
+            # cycle is most likely waiting on vehicles, and polling faster will not free them up.
+            previous, leftover = leftover, {mid for s in stats for mid in s["undispatched"]}
+            backlog = len(leftover - previous)
+            blocker = get_resource_blocker()
+            if blocker:
+                blocker.report()
+            ACTION_STATS.report()
+            VEHICLE_LOCKS.report()
+            WAIT_STATS.report()
+            WAIT_STATS.clear()
+            METRICS.set("open_missions", len(MISSION_STORE))
+            METRICS.set("mission_workers", len(grabbing_contexts))
+            METRICS.observe("mission_cycle_seconds", time.perf_counter() - start)
+            if autoscaler:
+                await autoscaler.adjust(len(MISSION_STORE), time.perf_counter() - start)
+            await asyncio.sleep(delay.schedule(backlog))
         except Exception as e:
             display_error(f"Error in mission logic: {e}")
 
@@ -60,33 +119,18 @@ async def main():
     headless = get_headless()
     url = get_url()
     async with async_playwright() as p:
+        shared = get_shared_context()
+        browsers = max(1, min(get_shared_browsers(), threads)) if shared else threads
         browser_pool = BrowserPool(
             playwright=p,
-            size=threads,
+            size=browsers,
             headless=headless
         )
         await browser_pool.start()
 
-        login_tasks = [
-            login_single(
-                username=username,
-                password=password,
-                thread_id=i + 1,
-                delay=i * 1.5,
-                browser_pool=browser_pool,
-                url=url
-            )
-            for i in range(threads)
-        ]
-
-        results = await asyncio.gather(*login_tasks)
-
-        contexts = []
-        for status, info, ctx in results:
-            if status == "Success":
-                contexts.append(ctx)
-            else:
-                display_error(f"Login failed: {info}")
+        session = SessionManager(browser_pool, username, password, url)
+        logged_in = await session.open_contexts(browsers)
+        contexts = split_into_tabs(logged_in, threads) if shared and logged_in else list(logged_in)
 
         if len(contexts) < 2:
             display_error("Not enough successful logins to start automation.")
@@ -98,8 +142,11 @@ async def main():
         display_info("Pooled settings:")
         display_info(f"Headless browsers: {'enabled' if headless else 'disabled'}.")
         display_info(f"Thread Count: {threads}")
+        display_info(f"Shared context mode: {'enabled' if shared else 'disabled'} ({browsers} browser(s)).")
         display_info(f"Dispatch type: {dispatch_type}.")
         display_info(f"Concurrent missions are currently {'enabled' if concurrent else 'disabled'}.")
+        display_info(f"Pipelined dispatch is currently {'enabled' if get_pipeline_dispatch() else 'disabled'}.")
+        display_info(f"Browser scaling is currently {'enabled' if get_browser_scaling() else 'disabled'}.")
 
         other_context = contexts[0]
         grabbing_contexts = contexts[1:]
@@ -108,13 +155,22 @@ async def main():
         else:
             mission_contexts = grabbing_contexts[:1]
 
-        mission_task = asyncio.create_task(mission_logic(grabbing_contexts, mission_contexts, url))
-        other_task = asyncio.create_task(other_logic(other_context, url))
+        autoscaler = None
+        if get_browser_scaling():
+            autoscaler = ContextAutoscaler(session, grabbing_contexts, shared_contexts=logged_in if shared else None)
+
+        mission_task = asyncio.create_task(mission_logic(grabbing_contexts, mission_contexts, url, session, autoscaler))
+        other_task = asyncio.create_task(other_logic(other_context, url, session))
+        refresh_task = asyncio.create_task(vehicle_refresh_logic(other_context, url))
+        metrics_task = asyncio.create_task(metrics_logic())
 
-        await asyncio.gather(mission_task, other_task)
+        await asyncio.gather(mission_task, other_task, refresh_task, metrics_task)
 
-        for ctx in contexts:
+        for ctx in [other_context] + grabbing_contexts:
             await ctx.close()
+        if shared:
+            for ctx in logged_in:
+                await ctx.close()
 
         await browser_pool.close_all()
 
@@ -0,0 +1,62 @@
+"""Actions per second for transport and alarm buttons: browser clicks vs context.request.
+
+Usage (from the repository root):
+
+    python -m benchmarks.actions --missions 50 --transports 50
+"""
+import argparse
+import asyncio
+
+from playwright.async_api import async_playwright
+
+from utils.actions import ACTION_STATS, perform_action
+from .fixtures import Scenario
+from .server import StandInServer
+
+MODES = ("click", "request")
+
+
+async def run_mode(page, scenario, url, mode):
+    ACTION_STATS.clear()
+    for vid in scenario.transports:
+        await page.goto(f"{url}vehicles/{vid}")
+        button = await page.query_selector("table#own-hospitals a.btn-success, div.prison-select a.btn-success")
+        await perform_action(page, button, "Transport", mode)
+    for mid in scenario.missions:
+        await page.goto(f"{url}missions/{mid}")
+        await perform_action(page, await page.query_selector("#alert_btn"), "Dispatch", mode)
+    return ACTION_STATS.counts[mode], ACTION_STATS.rate(mode)
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--missions", type=int, default=50)
+    parser.add_argument("--transports", type=int, default=50)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+
+    scenario = Scenario(missions=args.missions, vehicles=max(200, args.transports),
+                        transports=args.transports, vehicles_per_mission=50)
+    server = StandInServer(scenario).start()
+    results = {}
+    try:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=not args.headed)
+            page = await (await browser.new_context()).new_page()
+            for mode in MODES:
+                server.reset_hits()
+                count, rate = await run_mode(page, scenario, server.url, mode)
+                results[mode] = {"actions": count, "per_s": round(rate, 1), "hits": dict(server.snapshot_hits())}
+            await browser.close()
+    finally:
+        server.stop()
+
+    print(f"{'mode':<10}{'actions':>9}{'per s':>9}{'page loads after action':>26}")
+    for mode, r in results.items():
+        reloads = r["hits"].get("main", 0)
+        print(f"{mode:<10}{r['actions']:>9}{r['per_s']:>9.1f}{reloads:>26}")
+    return results
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
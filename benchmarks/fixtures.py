@@ -0,0 +1,237 @@
+import json
+import random
+
+VEHICLE_TYPES = [
+    ("Type 1 fire engine", 14),
+    ("Type 2 fire engine", 10),
+    ("Platform truck", 4),
+    ("Heavy rescue vehicle", 4),
+    ("Battalion chief unit", 3),
+    ("Water Tanker", 3),
+    ("HazMat", 2),
+    ("Mobile air", 2),
+    ("ALS Ambulance", 12),
+    ("BLS Ambulance", 8),
+    ("EMS Chief", 2),
+    ("Patrol car", 16),
+    ("Police Supervisor / Sheriff Unit", 3),
+    ("Police Prisoner Van", 2),
+    ("SWAT SUV", 2),
+    ("SWAT Armoured Vehicle", 1),
+    ("Flatbed Carrier", 2),
+    ("Wrecker", 2),
+]
+
+REQUIREMENT_ROWS = [
+    "Required Firetrucks",
+    "Required Platform Trucks",
+    "Required Heavy Rescue Vehicles",
+    "Required Battalion Chief Vehicles",
+    "Required HazMat Vehicles",
+    "Required Mobile Air Vehicles",
+    "Required Police Cars",
+    "Required Police Supervisors / Sheriff",
+]
+
+MISSION_NAMES = [
+    "Dumpster fire", "Car fire", "Grass fire", "Structure fire", "Gas leak",
+    "Traffic collision", "Shoplifting", "Bar fight", "Chemical spill", "Warehouse fire",
+]
+
+HOSPITALS = ["County General", "St. Mary's", "Mercy Medical", "University Hospital"]
+PRISONS = ["County Jail", "State Prison", "Police Station Holding"]
+
+
+class Scenario:
+    def __init__(self, missions=50, vehicles=1000, mission_types=40, transports=10,
+                 vehicles_per_mission=300, tasks=12, seed=1):
+        rng = random.Random(seed)
+        self.seed = seed
+        self.vehicle_types = {}
+        names = [n for n, _ in VEHICLE_TYPES]
+        weights = [w for _, w in VEHICLE_TYPES]
+        for i, vtype in enumerate(rng.choices(names, weights, k=vehicles)):
+            self.vehicle_types[str(100000 + i)] = vtype
+        self.vehicle_ids = list(self.vehicle_types)
+
+        self.mission_types = {}
+        for t in range(mission_types):
+            rows = rng.sample(REQUIREMENT_ROWS, rng.randint(1, 4))
+            self.mission_types[str(t)] = {
+                "name": f"{rng.choice(MISSION_NAMES)} {t}",
+                "vehicles": [(row, rng.randint(1, 3)) for row in rows],
+                "credits": rng.randint(100, 9000),
+                "patients": rng.choice([0, 0, 0, 1, 2, 4]),
+                "tow": rng.choice([0, 0, 0, 1, 2]),
+                "personnel": rng.choice([None, None, None, "6x SWAT Personnel (In SWAT )"]),
+            }
+
+        self.missions = {}
+        type_ids = list(self.mission_types)
+        for m in range(missions):
+            self.missions[str(5000000 + m)] = {
+                "type": rng.choice(type_ids),
+                "latitude": round(40.0 + rng.random(), 5),
+                "longitude": round(-74.0 + rng.random(), 5),
+                "state": rng.choice([0, 0, 1, 2]),
+            }
+
+        per_mission = min(vehicles_per_mission, len(self.vehicle_ids))
+        self.mission_rosters = {
+            mid: sorted(rng.sample(self.vehicle_ids, per_mission)) for mid in self.missions
+        }
+        self.mission_distances = {
+            mid: {vid: rng.randint(30, 3600) for vid in roster}
+            for mid, roster in self.mission_rosters.items()
+        }
+
+        self.transports = {}
+        for vid in rng.sample(self.vehicle_ids, min(transports, len(self.vehicle_ids))):
+            kind = "prison" if self.vehicle_types[vid] in ("Patrol car", "Police Prisoner Van") else "hospital"
+            pool = PRISONS if kind == "prison" else HOSPITALS
+            self.transports[vid] = {
+                "kind": kind,
+                "targets": [(str(700 + i), name, round(rng.uniform(0.5, 40.0), 1)) for i, name in enumerate(pool)],
+            }
+        self.tasks = [(f"Task {i}", f"Complete {rng.randint(1, 50)} missions") for i in range(tasks)]
+
+
+def _page(title, body, script=""):
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        f"<title>{title}</title></head><body>{body}"
+        f"{f'<script>{script}</script>' if script else ''}</body></html>"
+    )
+
+
+PANEL_COLORS = {0: "red", 1: "yellow", 2: "green"}
+
+
+def render_main(scenario):
+    panels = []
+    markers = []
+    for mid, m in scenario.missions.items():
+        mtype = scenario.mission_types[m["type"]]
+        panels.append(
+            f"<div id='mission_panel_{mid}' class='panel mission_panel_{PANEL_COLORS[m['state']]}'>"
+            f"<a href='/missions/{mid}'>{mtype['name']}</a></div>"
+        )
+        markers.append("missionMarkerAdd(" + json.dumps({
+            "id": int(mid), "mtid": int(m["type"]), "caption": mtype["name"],
+            "vehicle_state": m["state"], "latitude": m["latitude"], "longitude": m["longitude"],
+            "patients_count": mtype["patients"], "alliance_id": None, "icon": f"fire_{PANEL_COLORS[m['state']]}",
+        }) + ");")
+        for i in range(mtype["patients"]):
+            markers.append("patientMarkerAdd(" + json.dumps({
+                "id": int(mid) * 10 + i, "mission_id": int(mid), "name": f"Patient {i}",
+            }) + ");")
+    radio = "".join(
+        f"<li><img vehicle_id='{vid}' src='/images/icons/status5.png'> Transport request</li>"
+        for vid in scenario.transports
+    )
+    body = (
+        "<div id='map'></div>"
+        f"<div id='mission_list'>{''.join(panels)}</div>"
+        f"<ul id='radio_messages_important'>{radio}</ul>"
+    )
+    return _page("MissionChief", body, "".join(markers))
+
+
+def render_mission(scenario, mission_id):
+    mission = scenario.missions[mission_id]
+    mtype = scenario.mission_types[mission["type"]]
+    distances = scenario.mission_distances[mission_id]
+    rows = "".join(
+        f"<tr id='vehicle_sort_{vid}' sortvalue='{distances[vid]}'>"
+        f"<td><input type='checkbox' class='vehicle_checkbox' value='{vid}'></td>"
+        f"<td><small class='vehicle_caption'>{scenario.vehicle_types[vid]}</small></td></tr>"
+        for vid in scenario.mission_rosters[mission_id]
+    )
+    body = (
+        f"<h1 id='missionH1'>{mtype['name']}</h1>"
+        f"<a id='mission_help' href='/einsaetze/{mission['type']}?mission_id={mission_id}'>Help</a>"
+        f"<form id='mission-form' method='post' action='/missions/{mission_id}/alarm'>"
+        "<input type='submit' id='alert_btn' class='btn btn-success' value='Alarm'>"
+        f"<table id='vehicle_show_table_all'><tbody>{rows}</tbody></table>"
+        "</form>"
+    )
+    return _page(mtype["name"], body)
+
+
+def render_help(scenario, type_id):
+    mtype = scenario.mission_types[type_id]
+    req_rows = "".join(f"<tr><td>{row}</td><td>{count}</td></tr>" for row, count in mtype["vehicles"])
+    info_rows = [f"<tr><td>Average credits</td><td>{mtype['credits']} Credits</td></tr>"]
+    if mtype["patients"]:
+        info_rows.append(f"<tr><td>Max. Patients</td><td>{mtype['patients']}</td></tr>")
+    if mtype["tow"]:
+        info_rows.append(f"<tr><td>Maximum amount of cars to tow</td><td>{mtype['tow']}</td></tr>")
+    if mtype["personnel"]:
+        info_rows.append(f"<tr><td>Required Personnel</td><td>{mtype['personnel']}</td></tr>")
+    body = (
+        "<div id='iframe-inside-container'><div class='row'>"
+        "<div class='col-md-4'><table class='table'><thead><tr>"
+        "<th>Vehicle and Personnel Requirements</th><th></th></tr></thead>"
+        f"<tbody>{req_rows}</tbody></table></div>"
+        "<div class='col-md-4'><table class='table'><thead><tr>"
+        "<th>Other information</th><th></th></tr></thead>"
+        f"<tbody>{''.join(info_rows)}</tbody></table></div>"
+        "</div></div>"
+    )
+    return _page(mtype["name"], body)
+
+
+def render_vehicle(scenario, vehicle_id):
+    vtype = scenario.vehicle_types[vehicle_id]
+    body = f"<div id='vehicle-attr-type'><a href='/fahrzeugfarbe/0'>{vtype}</a></div>"
+    transport = scenario.transports.get(vehicle_id)
+    if transport and transport["kind"] == "hospital":
+        rows = "".join(
+            f"<tr><td>{name}</td><td>{dist} km</td>"
+            f"<td><a class='btn btn-success' href='/vehicles/{vehicle_id}/patient/{hid}'>Transport</a></td></tr>"
+            for hid, name, dist in transport["targets"]
+        )
+        body += f"<table id='own-hospitals'><tbody>{rows}</tbody></table>"
+    elif transport:
+        buttons = "".join(
+            f"<a class='btn btn-success' href='/vehicles/{vehicle_id}/gefangener/{pid}'>{name} Distance: {dist} km</a>"
+            for pid, name, dist in transport["targets"]
+        )
+        body += f"<div class='prison-select'>{buttons}</div>"
+        body += f"<a class='btn btn-xs btn-danger' href='/vehicles/{vehicle_id}/gefangene/entlassen'>Release</a>"
+    return _page(vtype, body)
+
+
+def render_dispatch_center(scenario):
+    links = "".join(
+        f"<a class='list-group-item' href='/vehicles/{vid}'>{scenario.vehicle_types[vid]}</a>"
+        for vid in scenario.vehicle_ids
+    )
+    return _page("Dispatch Center", f"<div class='list-group'>{links}</div>")
+
+
+def vehicle_listing(scenario):
+    type_ids = {name: i for i, (name, _) in enumerate(VEHICLE_TYPES)}
+    return [
+        {
+            "id": int(vid),
+            "caption": f"{vtype} {vid}",
+            "building_id": 9000 + int(vid) % 50,
+            "vehicle_type": type_ids[vtype],
+            "fms_real": 2,
+            "fms_show": 2,
+        }
+        for vid, vtype in scenario.vehicle_types.items()
+    ]
+
+
+def render_tasks(scenario):
+    panels = "".join(
+        "<div class='task_panel'><div class='panel-heading'>"
+        f"<div>{title}</div><div>{desc}</div></div>"
+        f"<span id='task_countdown_{i}'>1d 2h</span>"
+        "<div class='progress'><div style='position: absolute'>3 / 10</div></div>"
+        "<img class='navbar-icon'><span>500 Credits</span></div>"
+        for i, (title, desc) in enumerate(scenario.tasks)
+    )
+    return _page("Tasks", panels)
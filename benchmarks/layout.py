@@ -0,0 +1,149 @@
+"""Memory and throughput of one browser per worker vs worker tabs in a shared context.
+
+Usage (from the repository root):
+
+    python -m benchmarks.layout --workers 6 --missions 200
+"""
+import argparse
+import asyncio
+import os
+import shutil
+
+from playwright.async_api import async_playwright
+
+import data.requirement_cache as requirement_cache
+from data.mission_store import MISSION_STORE
+from dispatching import navigate_and_dispatch
+from missions import check_and_grab_missions
+from setup.tab_workers import split_into_tabs
+from .fixtures import Scenario
+from .run import fleet_from_scenario, prepare_workdir, reset_bot_state, timed_stage
+from .server import StandInServer
+
+LAYOUTS = ("per_browser", "shared")
+
+
+def _children():
+    children = {}
+    for pid in os.listdir("/proc"):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        children.setdefault(ppid, []).append(int(pid))
+    return children
+
+
+def _memory_kb(pid):
+    # PSS splits shared pages between processes, so Chromium's shared libraries aren't counted N times.
+    for path, key in ((f"/proc/{pid}/smaps_rollup", "Pss:"), (f"/proc/{pid}/status", "VmRSS:")):
+        try:
+            with open(path) as f:
+                for line in f:
+                    if line.startswith(key):
+                        return int(line.split()[1])
+        except OSError:
+            continue
+    return 0
+
+
+def browser_memory_mb():
+    children = _children()
+    stack, total = list(children.get(os.getpid(), [])), 0
+    while stack:
+        pid = stack.pop()
+        total += _memory_kb(pid)
+        stack.extend(children.get(pid, []))
+    return total / 1024
+
+
+async def open_workers(p, layout, workers, browsers, headless):
+    if layout == "per_browser":
+        opened = [await p.chromium.launch(headless=headless) for _ in range(workers)]
+        contexts = [await b.new_context() for b in opened]
+        for ctx in contexts:
+            await ctx.new_page()
+        return opened, contexts
+    opened = [await p.chromium.launch(headless=headless) for _ in range(browsers)]
+    shared = []
+    for b in opened:
+        ctx = await b.new_context()
+        await ctx.new_page()
+        shared.append(ctx)
+    tabs = split_into_tabs(shared, workers)
+    for tab in tabs:
+        if not tab.pages:
+            await tab.new_page()
+    return opened, tabs
+
+
+async def run_layout(p, args, layout, server, fleet):
+    opened, workers = await open_workers(p, layout, args.workers, args.browsers, not args.headed)
+    try:
+        reset_bot_state(fleet)
+        baseline = browser_memory_mb()
+        grab = await timed_stage(
+            "check_and_grab_missions", server, args.missions,
+            check_and_grab_missions(workers, len(workers), server.url),
+        )
+        dispatch = await timed_stage(
+            "navigate_and_dispatch", server, len(MISSION_STORE),
+            navigate_and_dispatch(workers, server.url),
+        )
+        peak = browser_memory_mb()
+        return {
+            "layout": layout,
+            "browsers": len(opened),
+            "workers": len(workers),
+            "idle_mb": round(baseline, 1),
+            "after_cycle_mb": round(peak, 1),
+            "grab_per_min": grab["per_min"],
+            "dispatch_per_min": dispatch["per_min"],
+            "cycle_s": round(grab["wall_s"] + dispatch["wall_s"], 3),
+        }
+    finally:
+        for b in opened:
+            await b.close()
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=6)
+    parser.add_argument("--browsers", type=int, default=1, help="Browsers used by the shared layout")
+    parser.add_argument("--missions", type=int, default=200)
+    parser.add_argument("--vehicles", type=int, default=2000)
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=list(LAYOUTS))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+
+    scenario = Scenario(missions=args.missions, vehicles=args.vehicles, seed=args.seed)
+    server = StandInServer(scenario).start()
+    fleet = fleet_from_scenario(scenario)
+    cwd = os.getcwd()
+    workdir = prepare_workdir()
+    os.chdir(workdir)
+    results = []
+    try:
+        requirement_cache._requirement_file = os.path.abspath("data/mission_type_requirements.json")
+        async with async_playwright() as p:
+            for layout in args.layouts:
+                results.append(await run_layout(p, args, layout, server, fleet))
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+        server.stop()
+
+    print(f"\n== {args.workers} workers / {args.missions} missions ==")
+    print(f"{'layout':<14}{'browsers':>10}{'idle MB':>10}{'cycle MB':>10}{'grab/min':>10}{'dispatch/min':>14}{'cycle (s)':>11}")
+    for r in results:
+        print(f"{r['layout']:<14}{r['browsers']:>10}{r['idle_mb']:>10.1f}{r['after_cycle_mb']:>10.1f}"
+              f"{r['grab_per_min']:>10.1f}{r['dispatch_per_min']:>14.1f}{r['cycle_s']:>11.3f}")
+    return results
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
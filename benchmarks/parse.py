@@ -0,0 +1,72 @@
+"""Per-mission requirement parse time: element-by-element DOM queries vs one evaluate call.
+
+Usage (from the repository root):
+
+    python -m benchmarks.parse --mission-types 40 --rounds 3
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from playwright.async_api import async_playwright
+
+from missions.helpers import get_val
+from missions.requirements import extract_mission_details, gather_requirements
+from .fixtures import Scenario
+from .server import StandInServer
+
+
+async def parse_dom(page):
+    requirements = await gather_requirements(page)
+    credits = await get_val(page, 'td:has-text("Average credits") + td', True)
+    patients = await get_val(page, 'td:has-text("Max. Patients") + td')
+    crashed = await get_val(page, 'td:has-text("Maximum amount of cars to tow") + td')
+    return requirements, credits, patients, crashed
+
+
+MODES = {"dom": parse_dom, "evaluate": extract_mission_details}
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mission-types", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+
+    scenario = Scenario(missions=0, vehicles=0, mission_types=args.mission_types, transports=0)
+    server = StandInServer(scenario).start()
+    timings = {mode: [] for mode in MODES}
+    mismatches = 0
+    try:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=not args.headed)
+            page = await browser.new_page()
+            for _ in range(args.rounds):
+                for type_id in scenario.mission_types:
+                    await page.goto(server.url + f"einsaetze/{type_id}", wait_until="domcontentloaded")
+                    results = {}
+                    for mode, parse in MODES.items():
+                        start = time.perf_counter()
+                        results[mode] = await parse(page)
+                        timings[mode].append((time.perf_counter() - start) * 1000)
+                    if results["dom"] != results["evaluate"]:
+                        mismatches += 1
+            await browser.close()
+    finally:
+        server.stop()
+
+    print(f"{'mode':<10}{'missions':>10}{'mean (ms)':>12}{'p50 (ms)':>10}{'p95 (ms)':>10}")
+    for mode, samples in timings.items():
+        samples.sort()
+        p95 = samples[int(len(samples) * 0.95) - 1] if samples else 0.0
+        print(f"{mode:<10}{len(samples):>10}{statistics.fmean(samples):>12.2f}"
+              f"{statistics.median(samples):>10.2f}{p95:>10.2f}")
+    if mismatches:
+        print(f"WARNING: {mismatches} pages parsed differently between modes")
+    return timings
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
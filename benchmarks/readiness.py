@@ -0,0 +1,63 @@
+"""Time spent waiting for pages per cycle: networkidle vs page-type readiness conditions.
+
+Usage (from the repository root):
+
+    python -m benchmarks.readiness --missions 50 --transports 10
+"""
+import argparse
+import asyncio
+
+from playwright.async_api import async_playwright
+
+from utils.readiness import WAIT_STATS, goto_ready
+from .fixtures import Scenario
+from .server import StandInServer
+
+MODES = ("networkidle", "conditions")
+
+
+def cycle_pages(scenario, url):
+    # The pages one bot cycle visits: main page for missions and transports, every mission,
+    # every transport vehicle and the tasks page.
+    pages = [(url, "main"), (url, "main")]
+    pages += [(f"{url}missions/{mid}", "mission") for mid in scenario.missions]
+    pages += [(f"{url}vehicles/{vid}", "vehicle") for vid in scenario.transports]
+    pages.append((f"{url}tasks/index", "tasks"))
+    return pages
+
+
+async def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--missions", type=int, default=50)
+    parser.add_argument("--transports", type=int, default=10)
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args(argv)
+
+    scenario = Scenario(missions=args.missions, vehicles=500, transports=args.transports, vehicles_per_mission=50)
+    server = StandInServer(scenario).start()
+    results = {}
+    try:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=not args.headed)
+            page = await (await browser.new_context()).new_page()
+            for mode in MODES:
+                WAIT_STATS.clear()
+                for target, page_type in cycle_pages(scenario, server.url):
+                    await goto_ready(page, target, page_type, mode=mode)
+                results[mode] = {t: (WAIT_STATS.counts[t], WAIT_STATS.seconds[t]) for t in WAIT_STATS.counts}
+            await browser.close()
+    finally:
+        server.stop()
+
+    print(f"{'page type':<12}{'pages':>7}" + "".join(f"{m + ' (s)':>18}" for m in MODES))
+    for page_type in results[MODES[0]]:
+        count = results[MODES[0]][page_type][0]
+        print(f"{page_type:<12}{count:>7}" + "".join(f"{results[m][page_type][1]:>18.2f}" for m in MODES))
+    totals = {m: sum(s for _, s in results[m].values()) for m in MODES}
+    print(f"{'total':<19}" + "".join(f"{totals[m]:>18.2f}" for m in MODES))
+    print(f"Wait time saved per cycle: {totals['networkidle'] - totals['conditions']:.2f}s")
+    return results
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,183 @@
+"""Offline benchmark of a full mission cycle against a local MissionChief stand-in.
+
+Usage (from the repository root):
+
+    python -m benchmarks.run --missions 50 500 2000 --vehicles 10000
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import tempfile
+import time
+
+from playwright.async_api import async_playwright
+
+import data.cache as cache
+import data.requirement_cache as requirement_cache
+from data.mission_store import MISSION_STORE
+from dispatching import grab_and_dispatch_pipelined, navigate_and_dispatch
+from missions import check_and_grab_missions
+from utils.transport import handle_transport_requests
+from utils.vehicle_data import gather_vehicle_data
+from .fixtures import Scenario
+from .server import StandInServer
+
+STAGES = ("vehicles", "missions", "dispatch", "pipeline", "transport")
+REPO_DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+
+def fleet_from_scenario(scenario):
+    fleet = {}
+    for vid, vtype in scenario.vehicle_types.items():
+        fleet.setdefault(vtype, []).append(vid)
+    return fleet
+
+
+def reset_bot_state(fleet):
+    cache.VEHICLE_LOCKS.clear()
+    cache.set_vehicle_data(fleet)
+    requirement_cache.clear_requirement_cache()
+
+
+async def timed_stage(name, server, items, coro):
+    server.reset_hits()
+    start = time.perf_counter()
+    result = await coro
+    wall = time.perf_counter() - start
+    hits = server.snapshot_hits()
+    firsts = [s["first_dispatch"] for s in result or [] if isinstance(s, dict) and s.get("first_dispatch")]
+    return {
+        "stage": name,
+        "wall_s": round(wall, 3),
+        "page_loads": sum(hits.values()),
+        "hits": dict(hits),
+        "items": items,
+        "per_min": round(items / wall * 60, 1) if wall > 0 else 0.0,
+        "first_dispatch_s": round(min(firsts) - start, 3) if firsts else None,
+    }
+
+
+async def run_scale(p, args, missions):
+    scenario = Scenario(
+        missions=missions,
+        vehicles=args.vehicles,
+        mission_types=args.mission_types,
+        transports=args.transports,
+        vehicles_per_mission=args.vehicles_per_mission,
+        seed=args.seed,
+    )
+    server = StandInServer(scenario).start()
+    browser = await p.chromium.launch(headless=not args.headed)
+    try:
+        contexts = []
+        for _ in range(args.contexts):
+            ctx = await browser.new_context()
+            await ctx.new_page()
+            contexts.append(ctx)
+        url = server.url
+        requirement_cache._requirement_file = os.path.abspath("data/mission_type_requirements.json")
+        fleet = fleet_from_scenario(scenario)
+        reset_bot_state(fleet)
+
+        results = []
+        if "vehicles" in args.stages:
+            if os.path.exists("data/vehicle_type_names.json"):
+                os.remove("data/vehicle_type_names.json")
+            results.append(await timed_stage(
+                "gather_vehicle_data", server, len(scenario.vehicle_types),
+                gather_vehicle_data(contexts, len(contexts), url),
+            ))
+            with open("data/vehicle_data.json") as f:
+                fleet = json.load(f)
+            reset_bot_state(fleet)
+        if "missions" in args.stages:
+            results.append(await timed_stage(
+                "check_and_grab_missions", server, missions,
+                check_and_grab_missions(contexts, len(contexts), url),
+            ))
+        if "dispatch" in args.stages and len(MISSION_STORE):
+            dispatch = await timed_stage(
+                "navigate_and_dispatch", server, missions,
+                navigate_and_dispatch(contexts, url),
+            )
+            # In batch mode nothing is dispatched before the whole grab pass has finished.
+            grab = next((r for r in results if r["stage"] == "check_and_grab_missions"), None)
+            if grab and dispatch["first_dispatch_s"] is not None:
+                dispatch["first_dispatch_s"] = round(grab["wall_s"] + dispatch["first_dispatch_s"], 3)
+            results.append(dispatch)
+        if "pipeline" in args.stages:
+            reset_bot_state(fleet)
+            results.append(await timed_stage(
+                "grab_and_dispatch_pipelined", server, missions,
+                grab_and_dispatch_pipelined(contexts, contexts, url, args.queue_size),
+            ))
+        if "transport" in args.stages:
+            results.append(await timed_stage(
+                "handle_transport_requests", server, len(scenario.transports),
+                handle_transport_requests(contexts[0], url),
+            ))
+        return {"missions": missions, "vehicles": args.vehicles, "contexts": args.contexts, "stages": results}
+    finally:
+        await browser.close()
+        server.stop()
+
+
+def print_report(report):
+    print(f"\n== {report['missions']} missions / {report['vehicles']} vehicles / {report['contexts']} contexts ==")
+    print(f"{'stage':<30}{'wall (s)':>10}{'page loads':>12}{'items':>8}{'per min':>10}{'1st dispatch (s)':>18}")
+    for r in report["stages"]:
+        first = f"{r['first_dispatch_s']:.3f}" if r["first_dispatch_s"] is not None else "-"
+        print(f"{r['stage']:<30}{r['wall_s']:>10.3f}{r['page_loads']:>12}{r['items']:>8}{r['per_min']:>10.1f}{first:>18}")
+
+
+def prepare_workdir():
+    workdir = tempfile.mkdtemp(prefix="mc_bench_")
+    os.makedirs(os.path.join(workdir, "data"))
+    for name in os.listdir(REPO_DATA):
+        if name.endswith(".json") and name not in ("vehicle_data.json", "mission_data.json"):
+            shutil.copy(os.path.join(REPO_DATA, name), os.path.join(workdir, "data", name))
+    return workdir
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--missions", type=int, nargs="+", default=[50, 500, 2000])
+    parser.add_argument("--vehicles", type=int, default=10000)
+    parser.add_argument("--mission-types", type=int, default=40)
+    parser.add_argument("--transports", type=int, default=10)
+    parser.add_argument("--vehicles-per-mission", type=int, default=300)
+    parser.add_argument("--contexts", type=int, default=2)
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--queue-size", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--json", help="Write the full report to this file")
+    return parser.parse_args(argv)
+
+
+async def main(argv=None):
+    args = parse_args(argv)
+    json_path = os.path.abspath(args.json) if args.json else None
+    cwd = os.getcwd()
+    workdir = prepare_workdir()
+    os.chdir(workdir)
+    reports = []
+    try:
+        async with async_playwright() as p:
+            for missions in args.missions:
+                report = await run_scale(p, args, missions)
+                print_report(report)
+                reports.append(report)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(reports, f, indent=2)
+    return reports
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
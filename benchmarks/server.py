@@ -0,0 +1,129 @@
+import json
+import re
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from . import fixtures
+
+
+class StandInServer:
+    def __init__(self, scenario, host="127.0.0.1", port=0):
+        self.scenario = scenario
+        self.hits = Counter()
+        self._lock = threading.Lock()
+        self._routes = [
+            ("GET", re.compile(r"^/$"), "main", self._main),
+            ("GET", re.compile(r"^/missions/(\d+)$"), "mission", self._mission),
+            ("POST", re.compile(r"^/missions/(\d+)/alarm$"), "alarm", self._redirect_home),
+            ("GET", re.compile(r"^/einsaetze/(\d+)$"), "help", self._help),
+            ("GET", re.compile(r"^/vehicles/(\d+)$"), "vehicle", self._vehicle),
+            ("GET", re.compile(r"^/vehicles/(\d+)/(patient|gefangener)/(\d+)$"), "transport", self._redirect_home),
+            ("GET", re.compile(r"^/vehicles/(\d+)/gefangene/entlassen$"), "release", self._redirect_home),
+            ("GET", re.compile(r"^/leitstellenansicht$"), "dispatch_center", self._dispatch_center),
+            ("GET", re.compile(r"^/api/vehicles$"), "vehicle_api", self._vehicle_api),
+            ("GET", re.compile(r"^/tasks/index$"), "tasks", self._tasks),
+            ("POST", re.compile(r"^/tasks/claim_all_rewards$"), "claim", self._redirect_home),
+        ]
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def reset_hits(self):
+        with self._lock:
+            self.hits.clear()
+
+    def snapshot_hits(self):
+        with self._lock:
+            return Counter(self.hits)
+
+    def dispatch(self, method, path):
+        path = re.sub(r"/{2,}", "/", urlsplit(path).path)
+        for route_method, pattern, name, handler in self._routes:
+            m = pattern.match(path)
+            if route_method == method and m:
+                with self._lock:
+                    self.hits[name] += 1
+                return handler(*m.groups())
+        return 404, {}, "Not found"
+
+    def _html(self, body):
+        return 200, {"Content-Type": "text/html; charset=utf-8"}, body
+
+    def _json(self, data):
+        return 200, {"Content-Type": "application/json; charset=utf-8"}, json.dumps(data)
+
+    def _redirect_home(self, *_):
+        return 302, {"Location": "/"}, ""
+
+    def _main(self):
+        return self._html(fixtures.render_main(self.scenario))
+
+    def _mission(self, mission_id):
+        if mission_id not in self.scenario.missions:
+            return 404, {}, "Not found"
+        return self._html(fixtures.render_mission(self.scenario, mission_id))
+
+    def _help(self, type_id):
+        if type_id not in self.scenario.mission_types:
+            return 404, {}, "Not found"
+        return self._html(fixtures.render_help(self.scenario, type_id))
+
+    def _vehicle(self, vehicle_id):
+        if vehicle_id not in self.scenario.vehicle_types:
+            return 404, {}, "Not found"
+        return self._html(fixtures.render_vehicle(self.scenario, vehicle_id))
+
+    def _dispatch_center(self):
+        return self._html(fixtures.render_dispatch_center(self.scenario))
+
+    def _vehicle_api(self):
+        return self._json(fixtures.vehicle_listing(self.scenario))
+
+    def _tasks(self):
+        return self._html(fixtures.render_tasks(self.scenario))
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self, method):
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                status, headers, body = server.dispatch(method, self.path)
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                self._respond("GET")
+
+            def do_POST(self):
+                self._respond("POST")
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,88 @@
+import asyncio
+import json
+import os
+from deep_translator import GoogleTranslator
+from data.config_settings import get_region
+from utils.pretty_print import display_info, display_error
+
+_data_dir = os.path.dirname(__file__)
+_table_file = os.path.join(_data_dir, "building_categories.json")
+_memo_file = os.path.join(_data_dir, "building_translations.json")
+
+_TABLE = None
+_MEMO = None
+_PENDING = {}
+_translator = None
+
+
+def _load_json(path):
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception as e:
+        display_error(f"Ignoring unreadable file {path}: {e}")
+        return {}
+
+
+def _category_table():
+    global _TABLE
+    if _TABLE is None:
+        tables = _load_json(_table_file)
+        _TABLE = dict(tables.get("default", {}))
+        _TABLE.update(tables.get(get_region().lower(), {}))
+    return _TABLE
+
+
+def _memo():
+    global _MEMO
+    if _MEMO is None:
+        _MEMO = _load_json(_memo_file)
+    return _MEMO
+
+
+def _save_memo():
+    tmp = _memo_file + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(_memo(), f, indent=2, ensure_ascii=False)
+    os.replace(tmp, _memo_file)
+
+
+def _translate(raw_key):
+    global _translator
+    if _translator is None:
+        _translator = GoogleTranslator(source="auto", target="en")
+    return _translator.translate(raw_key.replace("_", " "))
+
+
+def lookup_category(raw_key):
+    return _category_table().get(raw_key) or _memo().get(raw_key)
+
+
+async def _translate_and_memo(raw_key):
+    try:
+        translated = await asyncio.to_thread(_translate, raw_key)
+    except Exception as e:
+        display_error(f"[Building] Could not translate building key {raw_key}: {e}")
+        return raw_key.title()
+    category = translated.strip().title().replace(" ", "_")
+    _memo()[raw_key] = category
+    _save_memo()
+    display_info(f"[Building] Translated new building key {raw_key} -> {category}")
+    return category
+
+
+async def building_category(raw_key):
+    category = lookup_category(raw_key)
+    if category:
+        return category
+    # Concurrent building threads share one translation per key.
+    task = _PENDING.get(raw_key)
+    if task is None:
+        task = _PENDING[raw_key] = asyncio.ensure_future(_translate_and_memo(raw_key))
+    try:
+        return await task
+    finally:
+        if task.done():
+            _PENDING.pop(raw_key, None)
@@ -1,9 +1,129 @@
-import json, os
+import json, os, sys, time
+from collections import Counter
+from data.config_settings import get_lock_ttl
+from data.taxonomy import normalize_key, vehicle_type_keys
+from utils.metrics import METRICS
 from utils.pretty_print import display_info, display_error
 
 _vehicle_file = os.path.join(os.path.dirname(__file__), "vehicle_data.json")
 VEHICLE_DATA = None
-_LOCKED_VEHICLES = {}
+_FLEET = None
+
+
+class FleetIndex:
+    # Ids grouped by normalized type for one vehicle_data dict. Requirement names repeat
+    # across missions, so each name's resolved id tuple is built once and reused.
+    def __init__(self, vehicle_data):
+        self.source = vehicle_data
+        by_type = {}
+        seen = set()
+        for vtype, ids in vehicle_data.items():
+            bucket = by_type.setdefault(sys.intern(normalize_key(vtype)), [])
+            for vid in ids:
+                vid = str(vid)
+                if vid in seen or not vid.isdigit():
+                    continue
+                seen.add(vid)
+                bucket.append(vid)
+        self._by_type = {key: tuple(ids) for key, ids in by_type.items()}
+        self._size = len(seen)
+        self._lookups = {}
+
+    def __len__(self):
+        return self._size
+
+    def ids_for(self, name):
+        ids = self._lookups.get(name)
+        if ids is None:
+            ids = self._lookups[name] = tuple(
+                vid for key in vehicle_type_keys(name) for vid in self._by_type.get(key, ())
+            )
+        return ids
+
+
+class VehicleLockManager:
+    # Only used from the event loop thread, and no method awaits, so calls never interleave.
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.stats = Counter()
+        self._owner = {}
+        self._by_mission = {}
+        self._last_seen = {}
+
+    def __len__(self):
+        return len(self._owner)
+
+    def lock(self, vehicle_id, mission_id):
+        owner = self._owner.get(vehicle_id)
+        if owner is not None:
+            self.stats["contention" if owner != mission_id else "relock"] += 1
+            return False
+        self._owner[vehicle_id] = mission_id
+        self._by_mission.setdefault(mission_id, set()).add(vehicle_id)
+        self._last_seen.setdefault(mission_id, time.monotonic())
+        self.stats["locked"] += 1
+        return True
+
+    def is_locked(self, vehicle_id):
+        return vehicle_id in self._owner
+
+    def locked_ids(self):
+        # Live view: membership checks see locks taken after it was handed out.
+        return self._owner.keys()
+
+    def owner(self, vehicle_id):
+        return self._owner.get(vehicle_id)
+
+    def release_mission(self, mission_id):
+        return self._release(mission_id)
+
+    def _release(self, mission_id):
+        vehicles = self._by_mission.pop(mission_id, ())
+        self._last_seen.pop(mission_id, None)
+        for vid in vehicles:
+            del self._owner[vid]
+        self.stats["released"] += len(vehicles)
+        return len(vehicles)
+
+    def expire_missions(self, active_mission_ids):
+        # Vehicles stay locked while their mission is listed and for ttl seconds after it disappears.
+        now = time.monotonic()
+        active = set(active_mission_ids)
+        released = 0
+        for mid in active:
+            if mid in self._last_seen:
+                self._last_seen[mid] = now
+        for mid, seen in list(self._last_seen.items()):
+            if mid not in active and now - seen >= self.ttl:
+                released += self._release(mid)
+                self.stats["expired_missions"] += 1
+        return released
+
+    def vehicles(self, mission_id=None):
+        if mission_id is None:
+            return dict(self._owner)
+        return {vid: mission_id for vid in self._by_mission.get(mission_id, ())}
+
+    def report(self):
+        # Logs and exports the events since the last report, then starts a new count.
+        METRICS.set("locked_vehicles", len(self._owner))
+        if not self.stats:
+            return
+        for event, count in self.stats.items():
+            METRICS.inc("vehicle_lock_events_total", count, event=event)
+        display_info(f"Vehicle locks: {len(self._owner)} held, " + ", ".join(
+            f"{event} {self.stats[event]}" for event in sorted(self.stats)
+        ))
+        self.stats.clear()
+
+    def clear(self):
+        for mid in list(self._by_mission):
+            self._release(mid)
+        self.stats.clear()
+
+
+VEHICLE_LOCKS = VehicleLockManager(get_lock_ttl())
+
 
 def get_vehicle_data():
     global VEHICLE_DATA
@@ -14,21 +134,36 @@ def get_vehicle_data():
             VEHICLE_DATA = json.load(f)
     return VEHICLE_DATA
 
+def set_vehicle_data(vehicle_data):
+    global VEHICLE_DATA
+    VEHICLE_DATA = vehicle_data
+    return get_fleet_index()
+
+def get_fleet_index():
+    global _FLEET
+    data = get_vehicle_data()
+    if _FLEET is None or _FLEET.source is not data:
+        _FLEET = FleetIndex(data)
+    return _FLEET
+
 def lock_vehicle(vehicle_id, mission_id):
-    if vehicle_id in _LOCKED_VEHICLES:
-        return False
-    _LOCKED_VEHICLES[vehicle_id] = mission_id
-    return True
+    return VEHICLE_LOCKS.lock(vehicle_id, mission_id)
 
 def is_vehicle_locked(vehicle_id):
-    return vehicle_id in _LOCKED_VEHICLES
+    return VEHICLE_LOCKS.is_locked(vehicle_id)
+
+def locked_vehicle_ids():
+    return VEHICLE_LOCKS.locked_ids()
 
 def free_up_vehicles(mission_id):
-    global _LOCKED_VEHICLES
-    _LOCKED_VEHICLES = {vid: mid for vid, mid in _LOCKED_VEHICLES.items() if mid != mission_id}
-    display_info(f"Freed up vehicles for {mission_id}")
+    freed = VEHICLE_LOCKS.release_mission(mission_id)
+    display_info(f"Freed up {freed} vehicles for {mission_id}")
+
+def expire_vehicle_locks(active_mission_ids):
+    freed = VEHICLE_LOCKS.expire_missions(active_mission_ids)
+    if freed:
+        display_info(f"Released {freed} vehicles from finished missions ({len(VEHICLE_LOCKS)} still locked)")
+    return freed
 
 def get_locked_vehicles(mission_id=None):
-    if mission_id is None:
-        return dict(_LOCKED_VEHICLES)
-    return {vid: mid for vid, mid in _LOCKED_VEHICLES.items() if mid == mission_id}
+    return VEHICLE_LOCKS.vehicles(mission_id)
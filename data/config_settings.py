@@ -28,6 +28,47 @@ def get_threads():
 def get_browser_scaling():
     return config.getboolean('browser_settings', 'browser_scaling')
 
+def get_readiness_mode():
+    return config.get('browser_settings', 'readiness', fallback='conditions').strip().lower()
+
+def get_shared_context():
+    return config.getboolean('browser_settings', 'shared_context', fallback=False)
+
+def get_shared_browsers():
+    return config.getint('browser_settings', 'shared_browsers', fallback=1)
+
+def get_min_browsers():
+    return config.getint('browser_settings', 'min_browsers', fallback=2)
+
+def get_max_browsers():
+    return config.getint('browser_settings', 'max_browsers', fallback=6)
+
+def get_missions_per_browser():
+    return config.getint('browser_settings', 'missions_per_browser', fallback=20)
+
+def get_target_cycle_time():
+    return config.getint('browser_settings', 'target_cycle_time', fallback=60)
+
+def get_memory_ceiling():
+    return config.getint('browser_settings', 'memory_ceiling', fallback=85)
+
+
+# -----------------------------
+# Resource Blocking
+# -----------------------------
+def _get_list(section, option, fallback):
+    value = config.get(section, option, fallback=fallback)
+    return [v.strip() for v in value.split(',') if v.strip()]
+
+def get_resource_blocking_enabled():
+    return config.getboolean('resource_blocking', 'enabled', fallback=False)
+
+def get_blocked_resource_types():
+    return _get_list('resource_blocking', 'resource_types', 'image, font, media')
+
+def get_blocked_url_patterns():
+    return _get_list('resource_blocking', 'url_patterns', '')
+
 
 # -----------------------------
 # Mission Settings
@@ -47,6 +88,33 @@ def get_dynamic_missions():
 def get_concurrent_missions():
     return config.getboolean('missions', 'dispatch_concurrent_missions')
 
+def get_mission_snapshots():
+    return config.getboolean('missions', 'mission_snapshots', fallback=True)
+
+def get_lock_ttl():
+    return config.getfloat('missions', 'lock_ttl', fallback=60)
+
+def get_pipeline_dispatch():
+    return config.getboolean('missions', 'pipeline_dispatch', fallback=False)
+
+def get_pipeline_queue_size():
+    return config.getint('missions', 'pipeline_queue_size', fallback=8)
+
+def get_mission_list_source():
+    return config.get('missions', 'mission_list_source', fallback='request').strip().lower()
+
+def get_requirement_extraction():
+    return config.get('missions', 'requirement_extraction', fallback='evaluate').strip().lower()
+
+# -----------------------------
+# Vehicle Settings
+# -----------------------------
+def get_vehicle_roster_source():
+    return config.get('vehicles', 'roster_source', fallback='api').strip().lower()
+
+def get_vehicle_refresh_interval():
+    return config.getint('vehicles', 'refresh_interval', fallback=900)
+
 # -----------------------------
 # Other Settings
 # -----------------------------
@@ -56,10 +124,75 @@ def get_auto_training():
 def get_auto_tasks():
     return config.getboolean('other', 'auto_tasks')
 
+def get_transport_tabs():
+    return config.getint('other', 'transport_tabs', fallback=3)
+
+def get_action_mode():
+    return config.get('other', 'action_mode', fallback='request').strip().lower()
+
 def get_region():
     return config.get('bot', 'region')
 
 
+# -----------------------------
+# Metrics
+# -----------------------------
+def get_metrics_enabled():
+    return config.getboolean('metrics', 'enabled', fallback=False)
+
+def get_metrics_port():
+    return config.getint('metrics', 'port', fallback=0)
+
+def get_metrics_snapshot_interval():
+    return config.getint('metrics', 'snapshot_interval', fallback=60)
+
+
+# -----------------------------
+# Logging
+# -----------------------------
+def get_log_level():
+    return config.get('logging', 'level', fallback='INFO').strip().upper()
+
+def get_log_module_levels():
+    levels = {}
+    for entry in _get_list('logging', 'module_levels', ''):
+        module, _, level = entry.partition(':')
+        if module.strip() and level.strip():
+            levels[module.strip()] = level.strip().upper()
+    return levels
+
+def get_log_rate_limit():
+    return config.getint('logging', 'rate_limit', fallback=20)
+
+def get_log_rate_window():
+    return config.getfloat('logging', 'rate_window', fallback=10.0)
+
+def get_log_json_file():
+    return config.get('logging', 'json_file', fallback='').strip()
+
+def get_log_json_max_mb():
+    return config.getint('logging', 'json_max_mb', fallback=10)
+
+def get_log_json_backups():
+    return config.getint('logging', 'json_backups', fallback=3)
+
+
+# -----------------------------
+# Tracing
+# -----------------------------
+def get_tracing_enabled():
+    return config.getboolean('tracing', 'enabled', fallback=False)
+
+def get_slow_span_threshold():
+    return config.getfloat('tracing', 'slow_threshold', fallback=5.0)
+
+def get_trace_sample_rate():
+    return config.getfloat('tracing', 'trace_sample_rate', fallback=0.1)
+
+def get_trace_max_mb():
+    return config.getint('tracing', 'trace_max_mb', fallback=200)
+
+
 # -----------------------------
 # Delays & Dynamic Settings
 # -----------------------------
@@ -70,7 +203,16 @@ def get_dynamic_delay_missions_enabled():
     return config.getboolean('delays', 'dynamic_missions')
 
 def get_dynamic_delay_transport_enabled():
-    return config.getboolean('delays', 'dynamic_transport')
+    return config.getboolean('delays', 'dynamic_transport', fallback=False)
+
+def get_minimum_delay():
+    return config.getint('delays', 'minimum', fallback=5)
+
+def get_maximum_delay():
+    return config.getint('delays', 'maximum', fallback=300)
+
+def get_backoff_factor():
+    return config.getfloat('delays', 'backoff_factor', fallback=2.0)
 
 def get_mission_delay():
     return config.getint('delays', 'missions')
@@ -0,0 +1,67 @@
+import asyncio
+import json
+import os
+from data.config_settings import get_mission_snapshots
+from utils.pretty_print import display_error
+
+MISSION_FILE = os.path.join("data", "mission_data.json")
+
+
+def _write_atomic(path, payload):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+    os.replace(tmp, path)
+
+
+class MissionStore:
+    def __init__(self, path=MISSION_FILE):
+        self.path = path
+        self.version = 0
+        self._missions = {}
+        self._snapshot_task = None
+        self._dirty = False
+
+    def __len__(self):
+        return len(self._missions)
+
+    def publish(self, missions):
+        # Swap in a complete mapping; readers keep whatever mapping they already took.
+        self._missions = dict(missions)
+        self.version += 1
+        if get_mission_snapshots():
+            self.schedule_snapshot()
+
+    def snapshot(self):
+        return self._missions
+
+    def items(self):
+        return list(self._missions.items())
+
+    def get(self, mission_id, default=None):
+        return self._missions.get(mission_id, default)
+
+    def schedule_snapshot(self):
+        if self._snapshot_task and not self._snapshot_task.done():
+            self._dirty = True
+            return
+        self._snapshot_task = asyncio.get_running_loop().create_task(self._write_snapshots())
+
+    async def _write_snapshots(self):
+        while True:
+            self._dirty = False
+            missions = self._missions
+            try:
+                payload = json.dumps(missions, separators=(",", ":")).encode("utf-8")
+                await asyncio.to_thread(_write_atomic, self.path, payload)
+            except Exception as e:
+                display_error(f"Failed to snapshot mission data: {e}")
+            if not self._dirty:
+                return
+
+    async def flush(self):
+        if self._snapshot_task:
+            await self._snapshot_task
+
+
+MISSION_STORE = MissionStore()
@@ -0,0 +1,46 @@
+import copy
+import json
+import os
+from utils.pretty_print import display_info, display_error
+
+_requirement_file = os.path.join(os.path.dirname(__file__), "mission_type_requirements.json")
+_REQUIREMENTS = None
+CACHED_FIELDS = ("credits", "vehicles", "personnel", "liquid", "patients", "crashed_cars")
+
+def _load():
+    global _REQUIREMENTS
+    if _REQUIREMENTS is None:
+        _REQUIREMENTS = {}
+        if os.path.exists(_requirement_file):
+            try:
+                with open(_requirement_file, "r", encoding="utf-8") as f:
+                    _REQUIREMENTS = json.load(f)
+            except Exception as e:
+                display_error(f"Ignoring unreadable requirement cache: {e}")
+    return _REQUIREMENTS
+
+def get_cached_requirements(mission_type):
+    if not mission_type:
+        return None
+    entry = _load().get(mission_type)
+    return copy.deepcopy(entry) if entry is not None else None
+
+def store_requirements(mission_type, mission_data):
+    if not mission_type:
+        return
+    requirements = _load()
+    requirements[mission_type] = copy.deepcopy({k: mission_data[k] for k in CACHED_FIELDS})
+    tmp = _requirement_file + ".tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(requirements, f, separators=(",", ":"))
+        os.replace(tmp, _requirement_file)
+        display_info(f"Cached requirements for mission type {mission_type}")
+    except Exception as e:
+        display_error(f"Failed to write requirement cache: {e}")
+
+def clear_requirement_cache():
+    global _REQUIREMENTS
+    _REQUIREMENTS = {}
+    if os.path.exists(_requirement_file):
+        os.remove(_requirement_file)
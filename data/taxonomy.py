@@ -0,0 +1,102 @@
+import json
+import os
+import re
+from functools import lru_cache
+
+from utils.personnel_options import PERSONNEL_OPTIONS
+from utils.vehicle_options import VEHICLE_OPTIONS
+
+_data_dir = os.path.dirname(__file__)
+
+_VEHICLE_ALIASES = {}
+_PERSONNEL_ALIASES = {}
+_REQUIREMENT_MAP = {}
+_VEHICLE_OPTIONS = {}
+_PERSONNEL_OPTIONS = {}
+
+
+def _load_json(name):
+    with open(os.path.join(_data_dir, name), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _alias_index(groups):
+    # First group wins on overlapping synonyms, same as the old linear scan.
+    index = {}
+    for canonical, synonyms in groups.items():
+        for alias in [canonical, *synonyms]:
+            index.setdefault(alias.lower(), canonical)
+    return index
+
+
+def load_taxonomy():
+    global _VEHICLE_ALIASES, _PERSONNEL_ALIASES, _REQUIREMENT_MAP, _VEHICLE_OPTIONS, _PERSONNEL_OPTIONS
+    _VEHICLE_ALIASES = _alias_index(_load_json("vehicle_aliases.json"))
+    _PERSONNEL_ALIASES = _alias_index(_load_json("personnel_aliases.json"))
+    _REQUIREMENT_MAP = {k.lower(): v for k, v in _load_json("requirement_mapping.json").items()}
+    _VEHICLE_OPTIONS = {k.lower(): tuple(v) for k, v in VEHICLE_OPTIONS.items()}
+    _PERSONNEL_OPTIONS = {k.lower(): v for k, v in PERSONNEL_OPTIONS.items()}
+    for fn in (normalize_key, canonical_personnel, resolve_vehicle_name, resolve_personnel,
+               vehicle_type_keys, personnel_mapping):
+        fn.cache_clear()
+
+
+@lru_cache(maxsize=4096)
+def normalize_key(s):
+    return re.sub(r'\s+', ' ', s.strip().casefold())
+
+
+@lru_cache(maxsize=1024)
+def canonical_personnel(s):
+    s = re.sub(r'\([^)]*\)', '', s)
+    s = s.casefold()
+    s = re.sub(r'[^a-z0-9\s]', ' ', s)
+    s = re.sub(r'\s+', ' ', s).strip()
+    synonyms = {
+        'swat personnel': 'swat personnel',
+        'swat': 'swat personnel',
+        's w a t personnel': 'swat personnel'
+    }
+    return synonyms.get(s, s)
+
+
+@lru_cache(maxsize=2048)
+def resolve_vehicle_name(name: str) -> str:
+    n = name.lower()
+    return _VEHICLE_ALIASES.get(n, n)
+
+
+@lru_cache(maxsize=1024)
+def resolve_personnel(name: str) -> str:
+    return _PERSONNEL_ALIASES.get(name.lower(), name)
+
+
+def requirement_category(name, default="vehicles"):
+    return _REQUIREMENT_MAP.get(name.lower(), default)
+
+
+def vehicle_options(name):
+    return _VEHICLE_OPTIONS.get(name.lower(), ())
+
+
+def personnel_options(name):
+    return _PERSONNEL_OPTIONS.get(name.lower(), {})
+
+
+@lru_cache(maxsize=2048)
+def vehicle_type_keys(name):
+    keys = [normalize_key(name)] + [normalize_key(alt) for alt in vehicle_options(name)]
+    return tuple(dict.fromkeys(keys))
+
+
+@lru_cache(maxsize=1024)
+def personnel_mapping(name):
+    stripped = re.sub(r'\([^)]*\)', '', name)
+    for k in (canonical_personnel(name), normalize_key(name), normalize_key(stripped)):
+        m = personnel_options(k)
+        if m:
+            return m
+    return {}
+
+
+load_taxonomy()
@@ -1 +1,2 @@
 from .dispatcher import navigate_and_dispatch
+from .pipeline import grab_and_dispatch_pipelined
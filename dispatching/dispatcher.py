@@ -1,15 +1,30 @@
 import asyncio
-import json
-import math
+import copy
 import re
+import time
 
 from data.cache import free_up_vehicles
+from data.mission_store import MISSION_STORE
 from data.config_settings import get_dispatch_type, get_dispatch_incomplete
+from utils.actions import perform_action
+from utils.metrics import METRICS, timed
+from utils.tracing import mission_trace, span
 from utils.pretty_print import display_info, display_error
-from .vehicles import find_vehicle_ids, select_vehicles
+from .vehicles import find_vehicle_ids, select_vehicle_groups, select_vehicles
 from .personnel import handle_personnel
 from .navigation import load_mission_page
 
+COUNT_VEHICLE_ROWS_SCRIPT = "() => document.querySelectorAll('#vehicle_show_table_all tbody tr').length"
+
+# The extra vehicles arrive by XHR: done once rows were added or the button went away.
+MISSING_VEHICLES_LOADED_SCRIPT = """
+(rows) => {
+    const btn = document.querySelector("a.missing_vehicles_load.btn-warning");
+    return document.querySelectorAll("#vehicle_show_table_all tbody tr").length > rows
+        || !btn || btn.offsetParent === null;
+}
+"""
+
 async def read_water_status(page):
     bar = await page.query_selector('div[class*="mission_water_bar_selected_"]')
     if not bar:
@@ -48,83 +63,130 @@ async def handle_water_requirement(page, missing, mission_id):
     if selected < need and not get_dispatch_incomplete():
         missing.append(("Water", need - selected))
 
-async def navigate_and_dispatch(contexts, url):
-    with open('data/mission_data.json') as f:
-        missions = list(json.load(f).items())
-    pages = [ctx.pages[0] for ctx in contexts if ctx.pages]
-    if not pages:
-        return
-    chunk_size = math.ceil(len(missions) / len(pages))
-
-    async def process_mission(page, mission_id, data, prefix):
-        if not await load_mission_page(page, mission_id, data.get("mission_name", "Unknown"), url):
-            return
-        btn = await page.query_selector('a.missing_vehicles_load.btn-warning')
-        if btn:
+@timed("process_mission")
+async def process_mission(page, mission_id, data, prefix, url):
+    if not await load_mission_page(page, mission_id, data.get("mission_name", "Unknown"), url):
+        return False
+    btn = await page.query_selector('a.missing_vehicles_load.btn-warning')
+    if btn:
+        async with span("load_missing_vehicles"):
+            rows = await page.evaluate(COUNT_VEHICLE_ROWS_SCRIPT)
             await btn.click()
-            await page.wait_for_load_state('networkidle')
-        missing = []
-        await handle_personnel(page, data, missing, mission_id)
-        for req in data.get("vehicles", []):
-            needed = req.get("count", 0)
-            if needed <= 0:
-                continue
-            used_total = 0
-            for opt in req.get("options", []):
-                if used_total >= needed:
-                    break
-                ids = await find_vehicle_ids(opt)
-                used = await select_vehicles(page, ids, needed - used_total, opt, mission_id)
-                used_total += used
-            if used_total < needed and not get_dispatch_incomplete():
-                missing.append(("/".join(req.get("options", [])), needed - used_total))
-        crashed = data.get("crashed_cars", 0)
-        if crashed > 0:
-            flatbeds = await find_vehicle_ids("Flatbed Carrier")
-            used_flatbed = await select_vehicles(page, flatbeds, crashed, "Flatbed Carrier", mission_id)
-            covered = 2 * used_flatbed
+            try:
+                await page.wait_for_function(MISSING_VEHICLES_LOADED_SCRIPT, arg=rows, timeout=5000)
+            except Exception:
+                display_error(f"{prefix} Missing vehicles did not load for {mission_id}")
+    missing = []
+    await handle_personnel(page, data, missing, mission_id)
+    reqs = [req for req in data.get("vehicles", []) if req.get("count", 0) > 0]
+    groups = []
+    for req in reqs:
+        options = req.get("options", [])
+        tiers = [await find_vehicle_ids(opt) for opt in options]
+        groups.append((tiers, req["count"], "/".join(options)))
+    selected = await select_vehicle_groups(page, groups, mission_id)
+    for req, chosen in zip(reqs, selected):
+        needed = req["count"]
+        if len(chosen) < needed and not get_dispatch_incomplete():
+            missing.append(("/".join(req.get("options", [])), needed - len(chosen)))
+    crashed = data.get("crashed_cars", 0)
+    if crashed > 0:
+        flatbeds = await find_vehicle_ids("Flatbed Carrier")
+        used_flatbed = await select_vehicles(page, flatbeds, crashed, "Flatbed Carrier", mission_id)
+        covered = 2 * used_flatbed
+        remaining = max(0, crashed - covered)
+        if remaining > 0:
+            wreckers = []
+            for w in ["Wrecker", "Police Wrecker", "Fire Wrecker"]:
+                wreckers.extend(await find_vehicle_ids(w))
+            used = await select_vehicles(page, wreckers, remaining, "Wrecker Police Wrecker Fire Wrecker", mission_id)
+            covered += used
             remaining = max(0, crashed - covered)
-            if remaining > 0:
-                wreckers = []
-                for w in ["Wrecker", "Police Wrecker", "Fire Wrecker"]:
-                    wreckers.extend(await find_vehicle_ids(w))
-                used = await select_vehicles(page, wreckers, remaining, "Wrecker Police Wrecker Fire Wrecker", mission_id)
-                covered += used
-                remaining = max(0, crashed - covered)
-            if remaining > 0 and not get_dispatch_incomplete():
-                missing.append(("Tow Vehicles", remaining))
-        await handle_water_requirement(page, missing, mission_id)
-        if missing and not get_dispatch_incomplete():
-            free_up_vehicles(mission_id)
-            display_error(
-                f"{prefix} ❌ Mission {mission_id} missing requirements: "
-                + ", ".join([f"{m[0]}({m[1]})" for m in missing])
-            )
-            return
-        d = get_dispatch_type() or "default"
-        selector = 'a[class*="alert_next_alliance"]' if d.lower() == "alliance" else "#alert_btn"
-        try:
+        if remaining > 0 and not get_dispatch_incomplete():
+            missing.append(("Tow Vehicles", remaining))
+    await handle_water_requirement(page, missing, mission_id)
+    if missing and not get_dispatch_incomplete():
+        free_up_vehicles(mission_id)
+        display_error(
+            f"{prefix} ❌ Mission {mission_id} missing requirements: "
+            + ", ".join([f"{m[0]}({m[1]})" for m in missing])
+        )
+        return False
+    d = get_dispatch_type() or "default"
+    selector = 'a[class*="alert_next_alliance"]' if d.lower() == "alliance" else "#alert_btn"
+    try:
+        async with span("wait_dispatch_button"):
             btn = await page.wait_for_selector(selector, timeout=10000)
-        except:
-            btn = await page.query_selector("#alert_btn")
-        if btn:
-            try:
-                await btn.click()
-                await page.wait_for_load_state("networkidle")
-                display_info(f"{prefix} Dispatched mission {mission_id}")
-            except Exception as e:
-                display_error(f"{prefix} Dispatch click failed for {mission_id}: {e}")
-        else:
-            display_error(f"{prefix} Dispatch button missing for {mission_id}")
+    except:
+        btn = await page.query_selector("#alert_btn")
+    if btn:
+        try:
+            await perform_action(page, btn, f"{prefix} Dispatch")
+            display_info(f"{prefix} Dispatched mission {mission_id}")
+            return True
+        except Exception as e:
+            display_error(f"{prefix} Dispatch click failed for {mission_id}: {e}")
+    else:
+        display_error(f"{prefix} Dispatch button missing for {mission_id}")
+    return False
+
+async def dispatch_worker(page, queue, thread_id, url):
+    prefix = f"[Mission Thread {thread_id}]"
+    stats = {"thread": thread_id, "missions": 0, "dispatched": 0, "failed": 0, "busy": 0.0, "first_dispatch": None,
+             "undispatched": []}
+    while True:
+        item = await queue.get()
+        if item is None:
+            queue.task_done()
+            return stats
+        mission_id, data = item
+        start = time.perf_counter()
+        try:
+            async with mission_trace("dispatch", mission_id, page):
+                dispatched = await process_mission(page, mission_id, data, prefix, url)
+            if dispatched:
+                stats["dispatched"] += 1
+                METRICS.inc("missions_total", result="dispatched")
+                if stats["first_dispatch"] is None:
+                    stats["first_dispatch"] = time.perf_counter()
+            else:
+                stats["undispatched"].append(mission_id)
+                METRICS.inc("missions_total", result="skipped")
+        except Exception as e:
+            stats["failed"] += 1
+            stats["undispatched"].append(mission_id)
+            METRICS.inc("missions_total", result="failed")
+            display_error(f"{prefix} Error dispatching mission {mission_id}: {e}")
+        finally:
+            stats["missions"] += 1
+            stats["busy"] += time.perf_counter() - start
+            queue.task_done()
+
+def report_worker_stats(stats, elapsed):
+    for s in stats:
+        idle = max(0.0, elapsed - s["busy"])
+        display_info(
+            f"[Mission Thread {s['thread']}] {s['missions']} missions, {s['dispatched']} dispatched, "
+            f"{s['failed']} failed, busy {s['busy']:.1f}s, idle {idle:.1f}s"
+        )
+
+async def navigate_and_dispatch(contexts, url):
+    missions = MISSION_STORE.items()
+    pages = [ctx.pages[0] for ctx in contexts if ctx.pages]
+    if not pages or not missions:
+        return []
 
-    async def process_chunk(page, chunk, thread_id):
-        prefix = f"[Mission Thread {thread_id}]"
-        for mission_id, data in chunk:
-            await process_mission(page, mission_id, data, prefix)
+    queue = asyncio.Queue()
+    for mission_id, data in missions:
+        # Dispatch adjusts requirement counts, so work on a copy of the published data.
+        queue.put_nowait((mission_id, copy.deepcopy(data)))
+    workers = pages[:len(missions)]
+    for _ in workers:
+        queue.put_nowait(None)
+    return await run_dispatch_workers(workers, queue, url)
 
-    tasks = []
-    for i, page in enumerate(pages):
-        chunk = missions[i*chunk_size:(i+1)*chunk_size]
-        if chunk:
-            tasks.append(process_chunk(page, chunk, i+1))
-    await asyncio.gather(*tasks)
+async def run_dispatch_workers(pages, queue, url):
+    start = time.perf_counter()
+    stats = await asyncio.gather(*[dispatch_worker(page, queue, i + 1, url) for i, page in enumerate(pages)])
+    report_worker_stats(stats, time.perf_counter() - start)
+    return stats
@@ -1,13 +1,17 @@
 import asyncio
+from utils.metrics import timed
+from utils.tracing import traced
+from utils.readiness import goto_ready
 from utils.pretty_print import display_info, display_error
 
+@timed("mission_page_load")
+@traced("navigate")
 async def load_mission_page(page, mission_id, name, url):
     murl = url + f"missions/{mission_id}"
     for attempt in range(2):
         try:
             display_info(f"Navigating: {murl} (Attempt {attempt+1})")
-            await page.goto(murl, wait_until="domcontentloaded", timeout=10000)
-            await page.wait_for_selector('#missionH1', timeout=10000)
+            await goto_ready(page, murl, "mission")
             await page.wait_for_selector('#alert_btn', timeout=10000)
             display_info(f"Loaded mission {name} ({mission_id})")
             return True
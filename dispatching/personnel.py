@@ -1,9 +1,9 @@
-import re
 from data.config_settings import get_dispatch_incomplete
-from utils.personnel_options import get_personnel_options
+from data.taxonomy import normalize_key, personnel_mapping
+from utils.tracing import traced
 from .vehicles import find_vehicle_ids, select_vehicles
-from .utils import normalize_key, canonical_personnel
 
+@traced("personnel")
 async def handle_personnel(page, data, missing, mission_id):
     skip_roles = {"technical rescuer", "usar", "sharpshooter"}
     for person in data.get("personnel", []):
@@ -11,18 +11,7 @@ async def handle_personnel(page, data, missing, mission_id):
         needed = person["count"]
         if normalize_key(original) in skip_roles:
             continue
-        stripped = re.sub(r'\([^)]*\)', '', original)
-        keys = [
-            canonical_personnel(original),
-            normalize_key(original),
-            normalize_key(stripped)
-        ]
-        mapping = {}
-        for k in keys:
-            m = get_personnel_options(k)
-            if m:
-                mapping = m
-                break
+        mapping = personnel_mapping(original)
         selected = 0
         for vtype, per_vehicle in mapping.items():
             if selected >= needed:
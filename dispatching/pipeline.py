@@ -0,0 +1,40 @@
+import asyncio
+import copy
+import time
+
+from missions import check_and_grab_missions
+from utils.pretty_print import display_info
+from .dispatcher import run_dispatch_workers
+
+async def get_dispatch_page(context):
+    # The first page belongs to mission grabbing, dispatch gets its own tab.
+    while len(context.pages) < 2:
+        await context.new_page()
+    return context.pages[1]
+
+async def grab_and_dispatch_pipelined(grabbing_contexts, dispatch_contexts, url, queue_size):
+    pages = [await get_dispatch_page(ctx) for ctx in dispatch_contexts]
+    if not pages:
+        return []
+    queue = asyncio.Queue(maxsize=max(1, queue_size))
+
+    async def sink(mission_id, data):
+        await queue.put((mission_id, copy.deepcopy(data)))
+
+    start = time.perf_counter()
+    consumers = asyncio.create_task(run_dispatch_workers(pages, queue, url))
+    try:
+        await check_and_grab_missions(grabbing_contexts, len(grabbing_contexts), url, sink=sink)
+    finally:
+        for _ in pages:
+            await queue.put(None)
+    stats = await consumers
+
+    elapsed = time.perf_counter() - start
+    dispatched = sum(s["dispatched"] for s in stats)
+    firsts = [s["first_dispatch"] for s in stats if s["first_dispatch"] is not None]
+    first = f"{min(firsts) - start:.1f}s" if firsts else "n/a"
+    rate = dispatched / elapsed * 60 if elapsed > 0 else 0.0
+    display_info(f"Pipelined cycle: {dispatched} dispatched in {elapsed:.1f}s "
+                 f"({rate:.1f}/min), first dispatch after {first}")
+    return stats
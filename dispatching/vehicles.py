@@ -1,69 +1,105 @@
-from utils.pretty_print import display_info, display_error
-from utils.vehicle_options import get_vehicle_options
-from .utils import format_distance, normalize_key
-from data.cache import get_vehicle_data, lock_vehicle, is_vehicle_locked
+from utils.metrics import timed
+from utils.tracing import traced
+from utils.pretty_print import display_info, display_error, display_debug
+from .utils import format_distance
+from data.cache import get_fleet_index, lock_vehicle, locked_vehicle_ids
 
-async def get_all_vehicle_distances(page, ids):
-    script = """
-    (ids) => {
-        const result = {};
-        for (const id of ids) {
-            const el = document.querySelector(`#vehicle_sort_${id}`);
-            if (el) {
-                const val = el.getAttribute('sortvalue');
-                result[id] = val ? parseInt(val) : Infinity;
-            } else {
-                result[id] = Infinity;
+SELECT_VEHICLES_SCRIPT = """
+(groups) => {
+    const boxes = new Map();
+    for (const cb of document.querySelectorAll("input.vehicle_checkbox")) {
+        boxes.set(cb.getAttribute("value"), cb);
+    }
+    const distance = (id) => {
+        const el = document.getElementById(`vehicle_sort_${id}`);
+        const val = el && el.getAttribute("sortvalue");
+        return val ? parseInt(val) : Infinity;
+    };
+    const taken = new Set();
+    return groups.map(({ tiers, count }) => {
+        const chosen = [];
+        for (const tier of tiers) {
+            if (chosen.length >= count) break;
+            const candidates = [];
+            for (const id of tier) {
+                const cb = boxes.get(id);
+                if (cb && !cb.checked && !taken.has(id)) {
+                    candidates.push([id, distance(id)]);
+                }
+            }
+            candidates.sort((a, b) => a[1] - b[1]);
+            for (const [id, dist] of candidates) {
+                if (chosen.length >= count) break;
+                const cb = boxes.get(id);
+                cb.click();
+                cb.dispatchEvent(new Event("change", { bubbles: true }));
+                taken.add(id);
+                chosen.push([id, dist]);
             }
         }
-        return result;
+        return chosen;
+    });
+}
+"""
+
+UNSELECT_VEHICLES_SCRIPT = """
+(ids) => {
+    for (const id of ids) {
+        const cb = document.querySelector(`input.vehicle_checkbox[value="${id}"]`);
+        if (cb && cb.checked) {
+            cb.click();
+            cb.dispatchEvent(new Event("change", { bubbles: true }));
+        }
     }
-    """
-    return await page.evaluate(script, ids)
+}
+"""
 
-async def click_vehicle(page, cb, vehicle_id, label, dist, mission_id):
-    if await cb.is_checked():
-        return False
-    if not lock_vehicle(vehicle_id, mission_id):
-        return False
-    await page.evaluate(
-        '(c) => { c.click(); c.dispatchEvent(new Event("change", { bubbles: true })); }',
-        cb
-    )
-    display_info(f"Selected {label}({vehicle_id}) [{format_distance(dist)} away]")
-    return True
+def _as_tiers(ids):
+    if ids and isinstance(ids[0], (list, tuple)):
+        return [list(tier) for tier in ids]
+    return [list(ids)]
+
+@timed("select_vehicles")
+@traced("select")
+async def select_vehicle_groups(page, groups, mission_id):
+    groups = [(_as_tiers(ids), needed, label) for ids, needed, label in groups]
+    selected = [[] for _ in groups]
+    locked = locked_vehicle_ids()
+    while True:
+        payload = []
+        for (tiers, needed, _), chosen in zip(groups, selected):
+            remaining = max(0, needed - len(chosen))
+            payload.append({
+                "tiers": [[vid for vid in tier if vid not in locked] for tier in tiers] if remaining else [],
+                "count": remaining,
+            })
+        if not any(p["count"] and any(p["tiers"]) for p in payload):
+            break
+        picks = await page.evaluate(SELECT_VEHICLES_SCRIPT, payload)
+        lost = []
+        for (_, _, label), chosen, group_picks in zip(groups, selected, picks):
+            for vid, dist in group_picks:
+                if lock_vehicle(vid, mission_id):
+                    chosen.append(vid)
+                    display_debug(f"Selected {label}({vid}) [{format_distance(dist)} away]")
+                else:
+                    lost.append(vid)
+        if not lost:
+            break
+        await page.evaluate(UNSELECT_VEHICLES_SCRIPT, lost)
+    picked = [f"{len(chosen)}x {label}" for (_, _, label), chosen in zip(groups, selected) if chosen]
+    if picked:
+        display_info(f"Selected {sum(len(c) for c in selected)} vehicles for mission {mission_id}: {', '.join(picked)}")
+    return selected
 
 async def select_vehicles(page, ids, needed, label, mission_id):
-    checkboxes = await page.query_selector_all("input.vehicle_checkbox")
-    checkbox_map = {await cb.get_attribute("value"): cb for cb in checkboxes}
-    valid_ids = [vid for vid in ids if vid in checkbox_map and not is_vehicle_locked(vid)]
-    if not valid_ids:
+    if not ids or needed <= 0:
         return 0
-    distance_map = await get_all_vehicle_distances(page, valid_ids)
-    vehicles = [(vid, distance_map.get(vid, float('inf'))) for vid in valid_ids]
-    vehicles.sort(key=lambda x: x[1])
-    count = 0
-    for vid, dist in vehicles:
-        if count >= needed:
-            break
-        cb = checkbox_map[vid]
-        if await click_vehicle(page, cb, vid, label, dist, mission_id):
-            count += 1
-    return count
+    selected = await select_vehicle_groups(page, [(ids, needed, label)], mission_id)
+    return len(selected[0])
 
 async def find_vehicle_ids(name: str):
-    VEHICLE_DATA = get_vehicle_data()
-    norm = normalize_key(name)
-    ids = []
-    for k, v in VEHICLE_DATA.items():
-        if normalize_key(k) == norm:
-            ids.extend(v)
-    for alt in get_vehicle_options(name):
-        n = normalize_key(alt)
-        for k, v in VEHICLE_DATA.items():
-            if normalize_key(k) == n:
-                ids.extend(v)
-    ids = list(dict.fromkeys(ids))
+    ids = get_fleet_index().ids_for(name)
     if not ids:
         display_error(f"No vehicles found for '{name}'")
     return ids
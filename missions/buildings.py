@@ -1,61 +1,65 @@
 import os
 import json
 import asyncio
-from utils.pretty_print import display_info, display_error
-from deep_translator import GoogleTranslator
+from utils.pretty_print import display_info, display_error, display_debug
+from utils.readiness import goto_ready, wait_ready
+from data.building_translation import building_category
 
 BUILDING_FILE = os.path.join("data", "building_data.json")
+TOGGLED_SCRIPT = "(btn) => !btn.classList.contains('btn-danger')"
 
 async def gather_building_data_single(context, thread_id, url):
     try:
         display_info(f"[Building Thread {thread_id}] Starting building data grab")
         page = context.pages[0]
         display_info(f"[Building Thread {thread_id}] Navigating to {url}")
-        await page.goto(url)
-        await page.wait_for_load_state("networkidle")
+        await goto_ready(page, url, "main")
         display_info(f"[Building Thread {thread_id}] Page loaded")
 
         buttons = await page.query_selector_all("#btn-group-building-select a.building_selection")
         display_info(f"[Building Thread {thread_id}] Found {len(buttons)} building selection buttons")
         for idx, btn in enumerate(buttons):
             classes = await btn.get_attribute("class")
-            display_info(f"[Building Thread {thread_id}] Button {idx+1} classes: {classes}")
+            display_debug(f"[Building Thread {thread_id}] Button {idx+1} classes: {classes}")
             if "btn-danger" in classes:
-                display_info(f"[Building Thread {thread_id}] Clicking danger button {idx+1}")
+                display_debug(f"[Building Thread {thread_id}] Clicking danger button {idx+1}")
                 await btn.click()
-                await page.wait_for_load_state("networkidle")
-                display_info(f"[Building Thread {thread_id}] Button {idx+1} clicked and page reloaded")
+                try:
+                    await page.wait_for_function(TOGGLED_SCRIPT, arg=btn, timeout=5000)
+                except Exception:
+                    # The click reloaded the page instead of toggling in place.
+                    await wait_ready(page, "main")
+                display_debug(f"[Building Thread {thread_id}] Button {idx+1} clicked and list updated")
 
         captions = await page.query_selector_all("div.building_list_caption")
         display_info(f"[Building Thread {thread_id}] Found {len(captions)} building captions")
         building_data = {}
         for idx, cap in enumerate(captions):
-            display_info(f"[Building Thread {thread_id}] Processing caption {idx+1}")
+            display_debug(f"[Building Thread {thread_id}] Processing caption {idx+1}")
             img = await cap.query_selector("img.building_marker_image")
             if not img:
-                display_info(f"[Building Thread {thread_id}] Caption {idx+1} has no image, skipping")
+                display_debug(f"[Building Thread {thread_id}] Caption {idx+1} has no image, skipping")
                 continue
             src = await img.get_attribute("src")
             bid = await img.get_attribute("building_id")
-            display_info(f"[Building Thread {thread_id}] Caption {idx+1} src={src}, id={bid}")
+            display_debug(f"[Building Thread {thread_id}] Caption {idx+1} src={src}, id={bid}")
             if not src or not bid:
-                display_info(f"[Building Thread {thread_id}] Caption {idx+1} missing src or id, skipping")
+                display_debug(f"[Building Thread {thread_id}] Caption {idx+1} missing src or id, skipping")
                 continue
 
             raw_key = os.path.basename(src).replace(".png", "")
             if raw_key.startswith("building_"):
                 raw_key = raw_key[len("building_"):]
-            display_info(f"[Building Thread {thread_id}] Raw key={raw_key}")
+            display_debug(f"[Building Thread {thread_id}] Raw key={raw_key}")
 
-            translated = GoogleTranslator(source="auto", target="en").translate(raw_key.replace("_", " "))
-            display_info(f"[Building Thread {thread_id}] Translated key={translated}")
+            name = await building_category(raw_key)
+            display_debug(f"[Building Thread {thread_id}] Category for key={name}")
 
-            name = translated.strip().title().replace(" ", "_")
             if name not in building_data:
                 building_data[name] = []
-                display_info(f"[Building Thread {thread_id}] Created new category {name}")
+                display_debug(f"[Building Thread {thread_id}] Created new category {name}")
             building_data[name].append(bid)
-            display_info(f"[Building Thread {thread_id}] Added building id {bid} to category {name}")
+            display_debug(f"[Building Thread {thread_id}] Added building id {bid} to category {name}")
 
         display_info(f"[Building Thread {thread_id}] Finished with {len(building_data)} categories")
         return building_data
@@ -71,10 +75,10 @@ async def gather_building_data(contexts, thread_count, url):
 
     merged = {}
     for idx, r in enumerate(results):
-        display_info(f"[Building] Merging result from thread {idx+1} with {len(r)} categories")
+        display_debug(f"[Building] Merging result from thread {idx+1} with {len(r)} categories")
         for k, v in r.items():
             merged.setdefault(k, []).extend(v)
-            display_info(f"[Building] Category {k} now has {len(merged[k])} ids")
+            display_debug(f"[Building] Category {k} now has {len(merged[k])} ids")
 
     os.makedirs("data", exist_ok=True)
     with open(BUILDING_FILE, "w", encoding="utf-8") as f:
@@ -1,8 +1,12 @@
-import os, json
+from data.cache import expire_vehicle_locks
+from data.config_settings import get_mission_list_source
+from data.mission_store import MISSION_STORE
 from utils.pretty_print import display_info, display_error
+from utils.readiness import goto_ready
+from .mission_list import fetch_mission_ids
 from .threading import split_mission_ids_among_threads
 
-async def check_and_grab_missions(contexts, num_threads, url):
+async def check_and_grab_missions(contexts, num_threads, url, sink=None):
     if not isinstance(contexts, list):
         contexts = [contexts]
     if not contexts:
@@ -10,20 +14,26 @@ async def check_and_grab_missions(contexts, num_threads, url):
     if not contexts[0].pages:
         await contexts[0].new_page()
     try:
-        if os.path.exists("data/mission_data.json"):
-            os.remove("data/mission_data.json")
-        page = contexts[0].pages[0]
-        await page.goto(url)
-        await page.wait_for_load_state("networkidle")
-        panels = await page.query_selector_all(".mission_panel_red")
-        if not panels:
+        ids = active_ids = None
+        if get_mission_list_source() == "request":
+            ids, active_ids = await fetch_mission_ids(contexts[0], url)
+        if ids is None:
+            page = contexts[0].pages[0]
+            await goto_ready(page, url, "main")
+            panels = await page.query_selector_all(".mission_panel_red")
+            ids = [(await p.get_attribute("id")).split("_")[-1] for p in panels]
+            panels = await page.query_selector_all("div[id^='mission_panel_']")
+            active_ids = [(await p.get_attribute("id")).split("_")[-1] for p in panels]
+        expire_vehicle_locks(active_ids)
+        if not ids:
+            MISSION_STORE.publish({})
             display_info("No missions found, skipping this function.")
             return
-        ids = [(await p.get_attribute("id")).split("_")[-1] for p in panels]
         display_info(f"Found {len(ids)} mission IDs.")
-        data = await split_mission_ids_among_threads(ids, contexts, min(num_threads, len(contexts)), url)
-        with open("data/mission_data.json", "w") as f:
-            json.dump(data, f, indent=4)
-        display_info("Mission data collection complete. Stored mission data in mission_data.json.")
+        data = await split_mission_ids_among_threads(ids, contexts, min(num_threads, len(contexts)), url, sink)
+        MISSION_STORE.publish(data)
+        display_info(f"Mission data collection complete. {len(data)} missions ready for dispatch.")
     except Exception as e:
+        # Leaving last pass's missions in the store would dispatch them a second time.
+        MISSION_STORE.publish({})
         display_error(f"Error gathering mission data: {e}")
@@ -1,8 +1,15 @@
+from urllib.parse import urlsplit, parse_qs
+
 async def get_val(page, sel, split_first=False):
     el = await page.query_selector(sel)
     if not el:
         return 0
-    text = (await el.inner_text()).strip().lower()
+    return parse_int(await el.inner_text(), split_first)
+
+def parse_int(text, split_first=False):
+    if not text:
+        return 0
+    text = text.strip().lower()
     try:
         return int(text.split()[0]) if split_first else int(text)
     except:
@@ -17,3 +24,19 @@ def remove_plural_suffix(n):
     if parts and parts[-1].endswith("s") and len(parts[-1]) > 3:
         parts[-1] = parts[-1][:-1]
     return " ".join(parts)
+
+async def get_mission_type(page):
+    help_link = await page.query_selector("#mission_help")
+    if not help_link:
+        return None
+    href = await help_link.get_attribute("href")
+    if not href:
+        return None
+    parts = urlsplit(href)
+    mission_type = parts.path.rstrip("/").split("/")[-1]
+    if not mission_type.isdigit():
+        return None
+    overlays = parse_qs(parts.query).get("additive_overlays")
+    if overlays and overlays[0]:
+        mission_type += f"/{overlays[0]}"
+    return mission_type
@@ -0,0 +1,64 @@
+import json
+from utils.pretty_print import display_info, display_error
+
+MISSION_STATES = {0: "red", 1: "yellow", 2: "green"}
+_decoder = json.JSONDecoder()
+
+def _embedded_calls(html, function_name):
+    marker = function_name + "("
+    pos = html.find(marker)
+    while pos != -1:
+        try:
+            obj, end = _decoder.raw_decode(html, pos + len(marker))
+            if isinstance(obj, dict):
+                yield obj
+            pos = html.find(marker, end)
+        except ValueError:
+            pos = html.find(marker, pos + len(marker))
+
+def parse_mission_markers(html):
+    patients = {}
+    for patient in _embedded_calls(html, "patientMarkerAdd"):
+        mid = patient.get("mission_id")
+        if mid is not None:
+            patients[str(mid)] = patients.get(str(mid), 0) + 1
+
+    missions = {}
+    for marker in _embedded_calls(html, "missionMarkerAdd"):
+        mid = marker.get("id")
+        if mid is None:
+            continue
+        mid = str(mid)
+        mission_type = marker.get("mtid")
+        missions[mid] = {
+            "id": mid,
+            "type": str(mission_type) if mission_type is not None else None,
+            "caption": marker.get("caption", ""),
+            "state": MISSION_STATES.get(marker.get("vehicle_state"), "unknown"),
+            "latitude": marker.get("latitude"),
+            "longitude": marker.get("longitude"),
+            "alliance": bool(marker.get("alliance_id")),
+            # patients_count is only sent for missions with patients; fall back to the patient markers.
+            "patients": marker.get("patients_count") or patients.get(mid, 0),
+        }
+    return list(missions.values())
+
+async def fetch_mission_list(context, url):
+    response = await context.request.get(url)
+    if not response.ok:
+        raise RuntimeError(f"Main page request failed with status {response.status}")
+    if "users/sign_in" in response.url:
+        raise RuntimeError("Session expired while fetching mission list")
+    html = await response.text()
+    if "mission_list" not in html:
+        raise RuntimeError("Main page did not contain a mission list")
+    return parse_mission_markers(html)
+
+async def fetch_mission_ids(context, url):
+    try:
+        missions = await fetch_mission_list(context, url)
+    except Exception as e:
+        display_error(f"Fast mission list failed, falling back to page load: {e}")
+        return None, None
+    display_info(f"Read {len(missions)} mission markers from main page data.")
+    return [m["id"] for m in missions if m["state"] == "red"], [m["id"] for m in missions]
@@ -1,4 +1,6 @@
 import re
+from utils.actions import perform_action
+from utils.readiness import reload_ready
 
 async def handle_prisoner_transport(page):
     try:
@@ -8,8 +10,8 @@ async def handle_prisoner_transport(page):
                 for btn in await div.query_selector_all("a.btn-success, a.btn-warning"):
                     buttons.append((await extract_distance(btn), btn))
             if buttons:
-                await sorted(buttons, key=lambda x: x[0])[0][1].click()
-                await page.wait_for_load_state("networkidle")
+                if await perform_action(page, sorted(buttons, key=lambda x: x[0])[0][1], "Prisoner transport"):
+                    await reload_ready(page, "mission")
                 continue
             return False
     except:
@@ -1,65 +1,117 @@
-import json, re
-from .helpers import normalize_name
+import re
+from data.taxonomy import requirement_category, resolve_personnel
+from utils.metrics import timed
+from utils.tracing import traced
+from .helpers import normalize_name, parse_int
 
-with open("data/requirement_mapping.json") as f:
-    REQUIREMENT_MAP = json.load(f)
+MISSION_DETAILS_SCRIPT = """
+() => {
+    const has = (el, text) => el.textContent.toLowerCase().includes(text);
+    const table = (heading) => Array.from(document.querySelectorAll("div.col-md-4 > table"))
+        .find(t => Array.from(t.querySelectorAll("th")).some(th => has(th, heading)));
+    const cells = (row) => [row.querySelector("td:first-child"), row.querySelector("td:nth-child(2)")];
+    const nextCell = (text) => {
+        const td = Array.from(document.querySelectorAll("td")).find(el =>
+            has(el, text) && el.nextElementSibling && el.nextElementSibling.tagName === "TD");
+        return td ? td.nextElementSibling.innerText : null;
+    };
 
-with open("data/personnel_aliases.json") as f:
-    PERSONNEL_ALIASES = json.load(f)
+    const requirements = [];
+    const reqTable = table("vehicle and personnel requirements");
+    if (reqTable) {
+        for (const row of reqTable.querySelectorAll("tr")) {
+            if (!Array.from(row.querySelectorAll("td")).some(td => has(td, "required"))) continue;
+            const [n, c] = cells(row);
+            if (n && c) requirements.push([n.textContent, c.textContent]);
+        }
+    }
 
-def resolve_personnel(name: str) -> str:
-    n = name.lower()
-    for canonical, synonyms in PERSONNEL_ALIASES.items():
-        if n == canonical.lower() or n in [s.lower() for s in synonyms]:
-            return canonical
-    return name
+    const information = [];
+    const infoTable = table("other information");
+    if (infoTable) {
+        for (const row of infoTable.querySelectorAll("tr")) {
+            const [h, v] = cells(row);
+            if (h && v) information.push([h.innerText, v.innerHTML]);
+        }
+    }
 
-async def gather_requirements(page):
+    return {
+        requirements,
+        information,
+        credits: nextCell("average credits"),
+        patients: nextCell("max. patients"),
+        tow: nextCell("maximum amount of cars to tow"),
+    };
+}
+"""
+
+def build_requirements(requirement_rows, information_rows):
     reqs = {"vehicles": [], "personnel": [], "liquid": []}
 
+    for raw, count_text in requirement_rows:
+        name = normalize_name(raw)
+        if "probability" in name:
+            continue
+        count_text = count_text.strip().lower()
+        try:
+            count = int(count_text)
+        except:
+            count = count_text
+        category = requirement_category(name)
+        if category == "vehicles":
+            reqs["vehicles"].append({"name": name, "count": count})
+
+    for header, html in information_rows:
+        if "required personnel" in header.lower():
+            text = re.sub(r'<br\s*/?>', '\n', html)
+            text = re.sub(r'<[^>]+>', '', text)
+            for entry in re.split(r'[,\n]+', text.replace("\xa0", " ")):
+                m = re.match(r'(\d+)\s*x?\s*(.+)', entry.strip())
+                if m:
+                    c, n = int(m.group(1)), normalize_name(m.group(2))
+                    canonical = resolve_personnel(n)
+                    reqs["personnel"].append({"name": canonical, "count": c})
+
+    for p in reqs["personnel"]:
+        if p["name"].lower() == "swat personnel":
+            div = p["count"] // 6
+            if div > 0:
+                for v in reqs["vehicles"]:
+                    if "swat armoured vehicle" in v["name"].lower():
+                        v["count"] = max(0, v["count"] - div)
+                reqs["vehicles"] = [v for v in reqs["vehicles"] if not (v["name"].lower().startswith("swat armoured vehicle") and v["count"] == 0)]
+
+    return reqs
+
+@timed("requirement_parse")
+@traced("parse")
+async def gather_requirements(page):
+    requirement_rows = []
     table = await page.query_selector('div.col-md-4 > table:has(th:has-text("Vehicle and Personnel Requirements"))')
     if table:
         for row in await table.query_selector_all('tr:has(td:has-text("Required"))'):
             n_el = await row.query_selector("td:first-child")
             c_el = await row.query_selector("td:nth-child(2)")
             if n_el and c_el:
-                raw = await n_el.text_content()
-                name = normalize_name(raw)
-                if "probability" in name:
-                    continue
-                count_text = (await c_el.text_content()).strip().lower()
-                try:
-                    count = int(count_text)
-                except:
-                    count = count_text
-                category = REQUIREMENT_MAP.get(name, "vehicles")
-                if category == "vehicles":
-                    reqs["vehicles"].append({"name": name, "count": count})
+                requirement_rows.append((await n_el.text_content(), await c_el.text_content()))
 
+    information_rows = []
     table = await page.query_selector('div.col-md-4 > table:has(th:has-text("Other information"))')
     if table:
         for row in await table.query_selector_all("tr"):
             h = await row.query_selector("td:first-child")
             v = await row.query_selector("td:nth-child(2)")
             if h and v:
-                header = (await h.inner_text()).lower()
-                if "required personnel" in header:
-                    html = await v.inner_html()
-                    text = re.sub(r'<br\s*/?>', '\n', html)
-                    text = re.sub(r'<[^>]+>', '', text)
-                    for entry in re.split(r'[,\n]+', text.replace("\xa0", " ")):
-                        m = re.match(r'(\d+)\s*x?\s*(.+)', entry.strip())
-                        if m:
-                            c, n = int(m.group(1)), normalize_name(m.group(2))
-                            canonical = resolve_personnel(n)
-                            reqs["personnel"].append({"name": canonical, "count": c})
-    for p in reqs["personnel"]:
-        if p["name"].lower() == "swat personnel":
-            div = p["count"] // 6
-            if div > 0:
-                for v in reqs["vehicles"]:
-                    if "swat armoured vehicle" in v["name"].lower():
-                        v["count"] = max(0, v["count"] - div)
-                reqs["vehicles"] = [v for v in reqs["vehicles"] if not (v["name"].lower().startswith("swat armoured vehicle") and v["count"] == 0)]
+                information_rows.append((await h.inner_text(), await v.inner_html()))
 
-    return reqs
+    return build_requirements(requirement_rows, information_rows)
+
+@timed("requirement_parse")
+@traced("parse")
+async def extract_mission_details(page):
+    details = await page.evaluate(MISSION_DETAILS_SCRIPT)
+    requirements = build_requirements(details["requirements"], details["information"])
+    credits = parse_int(details["credits"], True)
+    patients = parse_int(details["patients"])
+    crashed = parse_int(details["tow"])
+    return requirements, credits, patients, crashed
@@ -0,0 +1,100 @@
+from data.config_settings import (
+    get_min_browsers,
+    get_max_browsers,
+    get_missions_per_browser,
+    get_target_cycle_time,
+    get_memory_ceiling,
+)
+from setup.tab_workers import ContextTabs
+from utils.pretty_print import display_info, display_warning
+
+# Consecutive quiet cycles required before a worker is logged out again.
+SHRINK_AFTER_CYCLES = 3
+
+
+def memory_usage_percent():
+    try:
+        with open("/proc/meminfo") as f:
+            info = {line.split(":")[0]: int(line.split()[1]) for line in f}
+        return 100.0 * (1 - info["MemAvailable"] / info["MemTotal"])
+    except (OSError, KeyError, ValueError, ZeroDivisionError):
+        return None
+
+
+class ContextAutoscaler:
+    def __init__(self, session, contexts, shared_contexts=None):
+        # `contexts` is the live list of mission workers shared with mission_logic.
+        # The first entry is never removed so a non-concurrent dispatch list stays valid.
+        self.session = session
+        self.browser_pool = session.browser_pool
+        self.contexts = contexts
+        # In shared context mode new workers are extra tabs, not extra logins.
+        self.shared_contexts = shared_contexts
+        # Bounds are configured as total browsers, one of which runs transports.
+        self.minimum = max(1, get_min_browsers() - 1)
+        self.maximum = max(self.minimum, get_max_browsers() - 1)
+        self.missions_per_worker = max(1, get_missions_per_browser())
+        self.target_cycle_time = get_target_cycle_time()
+        self.memory_ceiling = get_memory_ceiling()
+        self.quiet_cycles = 0
+        # Browsers launched for scaled-up workers, retired together with their context.
+        self._launched = {}
+
+    def desired_change(self, backlog, cycle_time):
+        workers = len(self.contexts)
+        if workers < self.minimum:
+            return 1, f"below minimum of {self.minimum}"
+        memory = memory_usage_percent()
+        if memory is not None and memory >= self.memory_ceiling and workers > self.minimum:
+            return -1, f"memory at {memory:.0f}%"
+        busy = backlog > workers * self.missions_per_worker or cycle_time > self.target_cycle_time
+        if busy:
+            self.quiet_cycles = 0
+            if workers >= self.maximum:
+                return 0, "at maximum"
+            if memory is not None and memory >= self.memory_ceiling:
+                return 0, f"memory at {memory:.0f}%"
+            return 1, f"{backlog} missions, {cycle_time:.0f}s cycle"
+        quiet = (
+            backlog <= (workers - 1) * self.missions_per_worker // 2
+            and cycle_time < self.target_cycle_time / 2
+        )
+        self.quiet_cycles = self.quiet_cycles + 1 if quiet else 0
+        if self.quiet_cycles >= SHRINK_AFTER_CYCLES and workers > self.minimum:
+            self.quiet_cycles = 0
+            return -1, f"{backlog} missions, {cycle_time:.0f}s cycle"
+        return 0, "steady"
+
+    async def adjust(self, backlog, cycle_time):
+        change, reason = self.desired_change(backlog, cycle_time)
+        if change > 0:
+            await self.grow(reason)
+        elif change < 0:
+            await self.shrink(reason)
+
+    async def grow(self, reason):
+        if self.shared_contexts:
+            self.contexts.append(ContextTabs(self.shared_contexts[len(self.contexts) % len(self.shared_contexts)]))
+            display_info(f"Scaled up to {len(self.contexts)} mission workers ({reason}).")
+            return
+        browser = await self.browser_pool.add_browser()
+        try:
+            ctx = await self.session.new_context(browser)
+        except Exception as e:
+            display_warning(f"Scaling up failed: {e}")
+            await self.browser_pool.retire(browser)
+            return
+        self._launched[ctx] = browser
+        self.contexts.append(ctx)
+        display_info(f"Scaled up to {len(self.contexts)} mission workers ({reason}).")
+
+    async def shrink(self, reason):
+        if len(self.contexts) <= 1:
+            return
+        ctx = self.contexts.pop()
+        launched = self._launched.pop(ctx, None)
+        browser = launched or ctx.browser
+        await ctx.close()
+        if browser and (launched or not browser.contexts):
+            await self.browser_pool.retire(browser)
+        display_info(f"Scaled down to {len(self.contexts)} mission workers ({reason}).")
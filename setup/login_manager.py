@@ -1,5 +1,10 @@
 import asyncio
+import json
+import os
 from utils.pretty_print import display_info, display_error, display_warning
+from setup.resource_blocking import get_resource_blocker
+from utils.metrics import METRICS, timed
+from utils.readiness import after_navigation, goto_ready
 
 MAX_RETRIES = 3
 
@@ -10,13 +15,32 @@ class BrowserPool:
         self.headless = headless
         self._queue = asyncio.Queue()
 
+    async def _launch(self):
+        return await self.playwright.chromium.launch(
+            headless=self.headless,
+            devtools=False
+        )
+
     async def start(self):
         for _ in range(self.size):
-            browser = await self.playwright.chromium.launch(
-                headless=self.headless,
-                devtools=False
-            )
-            await self._queue.put(browser)
+            await self._queue.put(await self._launch())
+
+    async def add_browser(self):
+        browser = await self._launch()
+        self.size += 1
+        await self._queue.put(browser)
+        return browser
+
+    async def retire(self, browser):
+        kept = []
+        while not self._queue.empty():
+            queued = self._queue.get_nowait()
+            if queued is not browser:
+                kept.append(queued)
+        for queued in kept:
+            self._queue.put_nowait(queued)
+        self.size -= 1
+        await browser.close()
 
     async def acquire(self):
         return await self._queue.get()
@@ -29,6 +53,7 @@ class BrowserPool:
             browser = await self._queue.get()
             await browser.close()
 
+@timed("login_single")
 async def login_single(
         username,
         password,
@@ -48,20 +73,16 @@ async def login_single(
 
             browser = await browser_pool.acquire()
             context = await browser.new_context()
+            blocker = get_resource_blocker()
+            if blocker:
+                await blocker.install(context)
             page = await context.new_page()
 
-            await page.goto(
-                url + "users/sign_in",
-                wait_until="domcontentloaded"
-            )
-
-            await page.wait_for_selector("form#new_user", timeout=5000)
+            await goto_ready(page, url + "users/sign_in", "login", timeout=5000)
 
             await page.fill('input[name="user[email]"]', username)
             await page.fill('input[name="user[password]"]', password)
-            await page.click('input[type="submit"]')
-
-            await page.wait_for_load_state("networkidle", timeout=10000)
+            await after_navigation(page, lambda: page.click('input[type="submit"]'), "any")
 
             if await page.locator("iframe[src*='captcha']").count() > 0:
                 display_warning(f"Thread {thread_id}: CAPTCHA detected")
@@ -69,6 +90,7 @@ async def login_single(
 
             if await page.locator('text=Invalid email or password').count() > 0:
                 display_error(f"Thread {thread_id}: Invalid credentials")
+                METRICS.inc("logins_total", result="invalid_credentials")
                 await context.close()
                 await browser_pool.release(browser)
                 return "Failure", "Invalid credentials", None
@@ -77,6 +99,7 @@ async def login_single(
                 raise RuntimeError(f"Unexpected domain after login: {page.url}")
 
             display_info(f"Thread {thread_id}: Login successful")
+            METRICS.inc("logins_total", result="success")
             await browser_pool.release(browser)
             return "Success", thread_id, context
 
@@ -91,6 +114,120 @@ async def login_single(
 
             if attempt == MAX_RETRIES:
                 display_error(f"Thread {thread_id}: Login failed after retries")
+                METRICS.inc("logins_total", result="failure")
                 return "Failure", str(e), None
 
             await asyncio.sleep(2)
+
+SESSION_FILE = os.path.join("data", "session_state.json")
+
+
+class SessionManager:
+    def __init__(self, browser_pool, username, password, url):
+        self.browser_pool = browser_pool
+        self.username = username
+        self.password = password
+        self.url = url
+        self.state = self._load()
+        self.expired = False
+        self.contexts = []
+        self._lock = asyncio.Lock()
+
+    def _load(self):
+        try:
+            with open(SESSION_FILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _save(self):
+        tmp = SESSION_FILE + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.state, f)
+        os.replace(tmp, SESSION_FILE)
+
+    def _on_response(self, response):
+        if "users/sign_in" in response.url and response.request.resource_type == "document":
+            self.expired = True
+
+    def _forget(self, context):
+        if context in self.contexts:
+            self.contexts.remove(context)
+
+    def _track(self, context):
+        self.contexts.append(context)
+        context.on("response", self._on_response)
+        context.on("close", self._forget)
+
+    async def new_context(self, browser=None):
+        # Without a browser one is borrowed from the pool; a given browser is used as is.
+        pooled = browser is None
+        if pooled:
+            browser = await self.browser_pool.acquire()
+        try:
+            context = await browser.new_context(storage_state=self.state)
+            blocker = get_resource_blocker()
+            if blocker:
+                await blocker.install(context)
+            await context.new_page()
+        finally:
+            if pooled:
+                await self.browser_pool.release(browser)
+        self._track(context)
+        return context
+
+    async def _fresh_login(self, thread_id):
+        status, info, context = await login_single(
+            username=self.username,
+            password=self.password,
+            thread_id=thread_id,
+            delay=0,
+            browser_pool=self.browser_pool,
+            url=self.url
+        )
+        if status != "Success":
+            display_error(f"Login failed: {info}")
+            return None
+        self.state = await context.storage_state()
+        self._save()
+        self.expired = False
+        return context
+
+    async def login(self):
+        if self.state:
+            context = await self.new_context()
+            page = context.pages[0]
+            await goto_ready(page, self.url, "any")
+            if "users/sign_in" not in page.url:
+                display_info("Reusing saved session.")
+                return context
+            display_warning("Saved session expired, logging in again.")
+            await context.close()
+        context = await self._fresh_login(1)
+        if context:
+            self._track(context)
+        return context
+
+    async def open_contexts(self, count):
+        # One real login at most; every other context starts from its cookies.
+        first = await self.login()
+        if not first:
+            return []
+        rest = await asyncio.gather(*[self.new_context() for _ in range(count - 1)])
+        return [first, *rest]
+
+    async def ensure_session(self):
+        if not self.expired:
+            return True
+        async with self._lock:
+            if not self.expired:
+                return True
+            display_warning("Session expired, logging in again.")
+            context = await self._fresh_login(0)
+            if not context:
+                return False
+            await context.close()
+            for tracked in list(self.contexts):
+                await tracked.add_cookies(self.state["cookies"])
+            display_info(f"Session restored for {len(self.contexts)} contexts.")
+            return True
@@ -0,0 +1,103 @@
+import re
+from collections import Counter
+from data.config_settings import (
+    get_resource_blocking_enabled,
+    get_blocked_resource_types,
+    get_blocked_url_patterns,
+)
+from utils.pretty_print import display_info, display_warning
+
+# Blocking these would stop pages from rendering or break the selectors we read.
+PROTECTED_TYPES = {"document", "script", "xhr", "fetch", "websocket", "eventsource"}
+
+# Routes are matched on URLs, so blocked resource types are expressed as file extensions.
+RESOURCE_EXTENSIONS = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "svg", "ico"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "media": ("mp3", "mp4", "ogg", "wav", "webm"),
+    "stylesheet": ("css",),
+}
+
+# Aborted requests never report a size, so savings are estimated from typical transfer sizes.
+ESTIMATED_SIZES = {
+    "image": 15_000,
+    "font": 40_000,
+    "media": 250_000,
+    "stylesheet": 30_000,
+    "other": 5_000,
+}
+
+
+class ResourceBlocker:
+    def __init__(self, resource_types, url_patterns):
+        types = {t.strip().lower() for t in resource_types if t.strip()}
+        protected = types & PROTECTED_TYPES
+        if protected:
+            display_warning(f"Not blocking protected resource types: {', '.join(sorted(protected))}")
+        unroutable = types - PROTECTED_TYPES - set(RESOURCE_EXTENSIONS)
+        if unroutable:
+            display_warning(f"Cannot block resource types by URL: {', '.join(sorted(unroutable))}")
+        self.resource_types = types & set(RESOURCE_EXTENSIONS)
+        self.url_patterns = [p.strip().lower() for p in url_patterns if p.strip()]
+        self.blocked = Counter()
+        self.estimated_bytes_saved = 0
+        self.pattern = self._compile()
+
+    def _compile(self):
+        # Only matching URLs are routed; everything else goes straight to the network
+        # without a round trip through this process.
+        parts = []
+        extensions = sorted({ext for t in self.resource_types for ext in RESOURCE_EXTENSIONS[t]})
+        if extensions:
+            parts.append(r"\.(?:" + "|".join(extensions) + r")(?:[?#]|$)")
+        parts.extend(re.escape(p) for p in self.url_patterns)
+        return re.compile("|".join(parts), re.IGNORECASE) if parts else None
+
+    def should_block(self, resource_type, url):
+        if resource_type == "document":
+            return False
+        if resource_type in self.resource_types:
+            return True
+        url = url.lower()
+        return any(p in url for p in self.url_patterns)
+
+    async def _handle(self, route):
+        request = route.request
+        resource_type = request.resource_type
+        if self.should_block(resource_type, request.url):
+            self.blocked[resource_type] += 1
+            self.estimated_bytes_saved += ESTIMATED_SIZES.get(resource_type, ESTIMATED_SIZES["other"])
+            await route.abort("blockedbyclient")
+        else:
+            await route.continue_()
+
+    async def install(self, context):
+        # Any route turns off Chromium's HTTP cache for the context (see config.ini).
+        if self.pattern:
+            await context.route(self.pattern, self._handle)
+
+    def stats(self):
+        return {
+            "blocked": sum(self.blocked.values()),
+            "blocked_by_type": dict(self.blocked),
+            "estimated_bytes_saved": self.estimated_bytes_saved,
+        }
+
+    def report(self):
+        s = self.stats()
+        by_type = ", ".join(f"{k}: {v}" for k, v in sorted(s["blocked_by_type"].items())) or "none"
+        display_info(
+            f"Blocked {s['blocked']} requests ({by_type}), "
+            f"an estimated {s['estimated_bytes_saved'] / 1_048_576:.1f} MB saved"
+        )
+
+
+_BLOCKER = None
+
+def get_resource_blocker():
+    global _BLOCKER
+    if _BLOCKER is None:
+        if not get_resource_blocking_enabled():
+            return None
+        _BLOCKER = ResourceBlocker(get_blocked_resource_types(), get_blocked_url_patterns())
+    return _BLOCKER
@@ -0,0 +1,42 @@
+from utils.pretty_print import display_info
+
+
+class ContextTabs:
+    # A worker's own tabs inside a logged-in context shared with other workers.
+    # Exposes the parts of BrowserContext the bot uses, so it can stand in for one.
+    def __init__(self, context, pages=None):
+        self.context = context
+        self.pages = list(pages or [])
+
+    @property
+    def request(self):
+        return self.context.request
+
+    @property
+    def browser(self):
+        return self.context.browser
+
+    def _forget(self, page):
+        if page in self.pages:
+            self.pages.remove(page)
+
+    async def new_page(self):
+        page = await self.context.new_page()
+        self.pages.append(page)
+        page.on("close", self._forget)
+        return page
+
+    async def close(self):
+        for page in list(self.pages):
+            await page.close()
+        self.pages.clear()
+
+
+def split_into_tabs(contexts, workers):
+    # The first worker on each context keeps the page used to log in.
+    tabs = []
+    for i in range(workers):
+        ctx = contexts[i % len(contexts)]
+        tabs.append(ContextTabs(ctx, ctx.pages[:1] if i < len(contexts) else None))
+    display_info(f"Running {workers} workers as tabs in {len(contexts)} shared context(s).")
+    return tabs
@@ -0,0 +1,107 @@
+import time
+from collections import Counter
+from data.config_settings import get_action_mode
+from utils.metrics import METRICS
+from utils.tracing import traced
+from utils.pretty_print import display_info, display_warning, display_error
+from utils.readiness import after_navigation
+
+# Describes the request a link or submit button would make, or null when it needs the page's own JS.
+ACTION_SCRIPT = """
+(el) => {
+    const meta = document.querySelector("meta[name='csrf-token']");
+    const token = meta ? meta.getAttribute("content") : null;
+    if (el.tagName === "A") {
+        const href = el.getAttribute("href");
+        if (!href || href.startsWith("#") || href.startsWith("javascript:") || el.hasAttribute("data-remote")) {
+            return null;
+        }
+        const method = (el.getAttribute("data-method") || "get").toUpperCase();
+        let body = null;
+        if (method !== "GET") {
+            const params = new URLSearchParams();
+            params.append("_method", method.toLowerCase());
+            if (token) params.append("authenticity_token", token);
+            body = params.toString();
+        }
+        return { url: el.href, method: method === "GET" ? "GET" : "POST", body, token };
+    }
+    const form = el.form;
+    if (!form) {
+        return null;
+    }
+    const data = new FormData(form, el);
+    if (token && !data.has("authenticity_token")) data.append("authenticity_token", token);
+    return { url: form.action, method: (form.getAttribute("method") || "get").toUpperCase(), body: new URLSearchParams(data).toString(), token };
+}
+"""
+
+
+class ActionStats:
+    def __init__(self):
+        self.counts = Counter()
+        self.seconds = Counter()
+
+    def record(self, mode, elapsed):
+        self.counts[mode] += 1
+        self.seconds[mode] += elapsed
+        METRICS.observe("action_seconds", elapsed, mode=mode)
+
+    def rate(self, mode):
+        return self.counts[mode] / self.seconds[mode] if self.seconds[mode] else 0.0
+
+    def report(self):
+        if not self.counts:
+            return
+        display_info("Actions: " + ", ".join(
+            f"{mode} {self.counts[mode]} ({self.rate(mode):.1f}/s)" for mode in sorted(self.counts)
+        ))
+
+    def clear(self):
+        self.counts.clear()
+        self.seconds.clear()
+
+
+ACTION_STATS = ActionStats()
+
+
+async def _send_action(page, spec):
+    headers = {"Referer": page.url}
+    if spec["token"]:
+        headers["X-CSRF-Token"] = spec["token"]
+    if spec["method"] == "GET":
+        response = await page.context.request.get(spec["url"], headers=headers)
+    else:
+        headers["Content-Type"] = "application/x-www-form-urlencoded"
+        response = await page.context.request.fetch(spec["url"], method=spec["method"], headers=headers, data=spec["body"])
+    try:
+        if not response.ok or "users/sign_in" in response.url:
+            raise RuntimeError(f"status {response.status} from {response.url}")
+    finally:
+        await response.dispose()
+
+
+@traced("action")
+async def perform_action(page, element, label, mode=None):
+    # Returns True when the action went through context.request and the page was left as it was,
+    # False when it was clicked and the page navigated.
+    start = time.perf_counter()
+    spec = None
+    if (mode or get_action_mode()) == "request":
+        try:
+            spec = await element.evaluate(ACTION_SCRIPT)
+        except Exception as e:
+            display_warning(f"{label} request could not be built, clicking instead: {e}")
+    if spec:
+        # Once the request is out the server may have acted on it, so a click could submit it twice.
+        try:
+            await _send_action(page, spec)
+        except Exception as e:
+            METRICS.inc("action_failures_total", mode="request")
+            display_error(f"{label} request failed: {e}")
+            raise
+        ACTION_STATS.record("request", time.perf_counter() - start)
+        return True
+    await after_navigation(page, element.click, "any")
+    ACTION_STATS.record("click", time.perf_counter() - start)
+    return False
@@ -0,0 +1,170 @@
+import asyncio
+import bisect
+import functools
+import json
+import os
+import time
+from data.config_settings import get_metrics_enabled, get_metrics_port, get_metrics_snapshot_interval
+from utils.pretty_print import display_info, display_error
+
+PREFIX = "missionchief_"
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+SNAPSHOT_FILE = os.path.join("data", "metrics.json")
+
+
+class Histogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self.counters = {}
+        self.gauges = {}
+        self.histograms = {}
+
+    def inc(self, name, value=1, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        if not self.enabled:
+            return
+        self.gauges[(name, tuple(sorted(labels.items())))] = value
+
+    def observe(self, name, value, **labels):
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        histogram.observe(value)
+
+    def snapshot(self):
+        def label_str(labels):
+            return ",".join(f"{k}={v}" for k, v in labels)
+
+        return {
+            "timestamp": time.time(),
+            "counters": {f"{n}{{{label_str(l)}}}" if l else n: v for (n, l), v in self.counters.items()},
+            "gauges": {f"{n}{{{label_str(l)}}}" if l else n: v for (n, l), v in self.gauges.items()},
+            "histograms": {
+                f"{n}{{{label_str(l)}}}" if l else n: {
+                    "count": h.count,
+                    "sum": round(h.sum, 6),
+                    "buckets": dict(zip([*map(str, BUCKETS), "+Inf"], h.counts)),
+                }
+                for (n, l), h in self.histograms.items()
+            },
+        }
+
+    def prometheus_text(self):
+        def fmt(labels, extra=()):
+            pairs = [*labels, *extra]
+            if not pairs:
+                return ""
+            return "{" + ",".join(f'{k}="{v}"' for k, v in pairs) + "}"
+
+        lines = []
+        for kind, metrics in (("counter", self.counters), ("gauge", self.gauges)):
+            typed = set()
+            for (name, labels), value in sorted(metrics.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {PREFIX}{name} {kind}")
+                    typed.add(name)
+                lines.append(f"{PREFIX}{name}{fmt(labels)} {value}")
+        typed = set()
+        for (name, labels), h in sorted(self.histograms.items(), key=lambda item: item[0]):
+            if name not in typed:
+                lines.append(f"# TYPE {PREFIX}{name} histogram")
+                typed.add(name)
+            cumulative = 0
+            for bound, count in zip([*map(str, BUCKETS), "+Inf"], h.counts):
+                cumulative += count
+                lines.append(f"{PREFIX}{name}_bucket{fmt(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{PREFIX}{name}_sum{fmt(labels)} {h.sum}")
+            lines.append(f"{PREFIX}{name}_count{fmt(labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+
+METRICS = MetricsRegistry(get_metrics_enabled())
+
+
+def timed(name):
+    # Wraps an async hot path with a latency histogram and a failure counter.
+    # With metrics disabled the function is returned untouched.
+    def decorate(fn):
+        if not METRICS.enabled:
+            return fn
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            except Exception:
+                METRICS.inc(f"{name}_failures_total")
+                raise
+            finally:
+                METRICS.observe(f"{name}_seconds", time.perf_counter() - start)
+        return wrapper
+    return decorate
+
+
+async def _serve_scrape(reader, writer):
+    try:
+        request_line = await reader.readline()
+        while (await reader.readline()).strip():
+            pass
+        parts = request_line.decode("latin-1").split()
+        if len(parts) >= 2 and parts[1].split("?")[0] == "/metrics":
+            status, body = "200 OK", METRICS.prometheus_text()
+        else:
+            status, body = "404 Not Found", "Not found\n"
+        payload = body.encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status}\r\nContent-Type: text/plain; version=0.0.4\r\n"
+            f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode("latin-1") + payload
+        )
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+def _write_snapshot(payload):
+    tmp = SNAPSHOT_FILE + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(payload)
+    os.replace(tmp, SNAPSHOT_FILE)
+
+
+async def metrics_logic():
+    if not METRICS.enabled:
+        return
+    port = get_metrics_port()
+    server = None
+    if port:
+        server = await asyncio.start_server(_serve_scrape, "127.0.0.1", port)
+        display_info(f"Serving metrics on http://127.0.0.1:{port}/metrics")
+    interval = get_metrics_snapshot_interval()
+    if interval <= 0:
+        if server:
+            await server.serve_forever()
+        return
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(_write_snapshot, json.dumps(METRICS.snapshot()))
+        except Exception as e:
+            display_error(f"Failed to write metrics snapshot: {e}")
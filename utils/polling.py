@@ -0,0 +1,29 @@
+from utils.pretty_print import display_info
+
+
+class AdaptiveDelay:
+    def __init__(self, name, base, minimum, maximum, factor, enabled):
+        self.name = name
+        self.base = base
+        self.minimum = max(1, min(minimum, base))
+        self.maximum = max(maximum, base)
+        self.factor = max(1.0, factor)
+        self.enabled = enabled
+        self.idle_cycles = 0
+
+    def next_delay(self, backlog):
+        if not self.enabled:
+            return self.base, "fixed delay"
+        if backlog > 0:
+            self.idle_cycles = 0
+            # The more work is waiting, the sooner we come back for it.
+            delay = max(self.minimum, self.base / (1 + backlog))
+            return delay, f"{backlog} pending"
+        self.idle_cycles += 1
+        delay = min(self.maximum, self.base * self.factor ** (self.idle_cycles - 1))
+        return delay, f"idle for {self.idle_cycles} cycle{'s' if self.idle_cycles != 1 else ''}"
+
+    def schedule(self, backlog):
+        delay, reason = self.next_delay(backlog)
+        display_info(f"Next {self.name} poll in {delay:.0f}s ({reason}).")
+        return delay
@@ -1,14 +1,130 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+import time
 import art
+from data.config_settings import (
+    get_log_level,
+    get_log_module_levels,
+    get_log_rate_limit,
+    get_log_rate_window,
+    get_log_json_file,
+    get_log_json_max_mb,
+    get_log_json_backups,
+)
+
+ROOT_LOGGER = "bot"
+COLORS = {logging.ERROR: "\033[91m", logging.WARNING: "\033[93m"}
+_NUMBERS = re.compile(r"\d+(\.\d+)?")
+
+
+class ConsoleFormatter(logging.Formatter):
+    def format(self, record):
+        message = record.getMessage()
+        suppressed = getattr(record, "suppressed", 0)
+        if suppressed:
+            message = f"{message} (+{suppressed} similar lines suppressed)"
+        color = COLORS.get(record.levelno)
+        return f"{color}{message}\033[0m" if color else message
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        return json.dumps({
+            "time": round(record.created, 3),
+            "level": record.levelname,
+            "module": record.name[len(ROOT_LOGGER) + 1:],
+            "message": record.getMessage(),
+        }, ensure_ascii=False)
+
+
+class RateLimitFilter(logging.Filter):
+    # Lines that differ only in their numbers share a budget per window;
+    # the first line of the next window carries how many were held back.
+    # The count rides on the record, so only the console formatter shows it.
+    def __init__(self, limit, window):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self._buckets = {}
+
+    def filter(self, record):
+        if self.limit <= 0 or record.levelno >= logging.ERROR:
+            return True
+        key = (record.name, _NUMBERS.sub("#", str(record.msg)))
+        now = time.monotonic()
+        start, count, suppressed = self._buckets.get(key, (now, 0, 0))
+        if now - start >= self.window:
+            record.suppressed = suppressed
+            self._buckets[key] = (now, 1, 0)
+            return True
+        if count < self.limit:
+            self._buckets[key] = (start, count + 1, suppressed)
+            return True
+        self._buckets[key] = (start, count, suppressed + 1)
+        return False
+
+
+def _setup():
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.setLevel(get_log_level())
+    logger.propagate = False
+    for module, level in get_log_module_levels().items():
+        logging.getLogger(f"{ROOT_LOGGER}.{module}").setLevel(level)
+
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(ConsoleFormatter())
+    console.addFilter(RateLimitFilter(get_log_rate_limit(), get_log_rate_window()))
+    handlers = [console]
+    json_file = get_log_json_file()
+    if json_file:
+        directory = os.path.dirname(json_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        rotating = logging.handlers.RotatingFileHandler(
+            json_file,
+            maxBytes=get_log_json_max_mb() * 1_048_576,
+            backupCount=get_log_json_backups(),
+            encoding="utf-8",
+        )
+        rotating.setFormatter(JsonFormatter())
+        handlers.append(rotating)
+
+    # Callers only enqueue; terminal and file writes happen on the listener thread.
+    records = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(records))
+    listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return logger
+
+
+_LOGGER = _setup()
+
+
+def _log(level, message):
+    module = sys._getframe(2).f_globals.get("__name__", "")
+    logger = logging.getLogger(f"{ROOT_LOGGER}.{module}") if module else _LOGGER
+    if logger.isEnabledFor(level):
+        logger.log(level, message)
 
 def display_message(message):
     ascii_art = art.text2art(message)
-    print(ascii_art)
+    _log(logging.INFO, ascii_art)
 
 def display_error(message):
-    print(f"\033[91m{message}\033[0m")
+    _log(logging.ERROR, message)
 
 def display_warning(message):
-    print(f"\033[93m{message}\033[0m")
+    _log(logging.WARNING, message)
 
 def display_info(message):
-    print(f"{message}")
+    _log(logging.INFO, message)
+
+def display_debug(message):
+    _log(logging.DEBUG, message)
@@ -0,0 +1,74 @@
+import time
+from collections import Counter
+from data.config_settings import get_readiness_mode
+from utils.pretty_print import display_info
+
+# What has to be in the DOM before each page type can be read. The game renders these server-side,
+# so they are present at DOMContentLoaded; the selectors guard against redirects and partial loads.
+# None means DOMContentLoaded alone is enough.
+READY_SELECTORS = {
+    "main": "#mission_list",
+    "mission": "#missionH1",
+    "mission_help": "#iframe-inside-container",
+    "vehicle": "#vehicle-attr-type",
+    "dispatch_center": ".list-group",
+    "tasks": None,
+    "login": "form#new_user",
+    "any": None,
+}
+
+
+class WaitStats:
+    def __init__(self):
+        self.counts = Counter()
+        self.seconds = Counter()
+
+    def record(self, page_type, elapsed):
+        self.counts[page_type] += 1
+        self.seconds[page_type] += elapsed
+
+    def total(self):
+        return sum(self.seconds.values())
+
+    def report(self):
+        if not self.counts:
+            return
+        display_info(f"Page waits: {self.total():.1f}s total (" + ", ".join(
+            f"{t} {self.counts[t]}x {self.seconds[t] / self.counts[t]:.2f}s" for t in sorted(self.counts)
+        ) + ")")
+
+    def clear(self):
+        self.counts.clear()
+        self.seconds.clear()
+
+
+WAIT_STATS = WaitStats()
+
+
+async def wait_ready(page, page_type, timeout=10000, mode=None):
+    start = time.perf_counter()
+    if (mode or get_readiness_mode()) == "networkidle":
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+    else:
+        await page.wait_for_load_state("domcontentloaded", timeout=timeout)
+        selector = READY_SELECTORS[page_type]
+        if selector:
+            await page.wait_for_selector(selector, state="attached", timeout=timeout)
+    WAIT_STATS.record(page_type, time.perf_counter() - start)
+
+
+async def goto_ready(page, url, page_type, timeout=10000, mode=None):
+    await page.goto(url, wait_until="commit", timeout=timeout)
+    await wait_ready(page, page_type, timeout, mode)
+
+
+async def reload_ready(page, page_type, timeout=10000, mode=None):
+    await page.reload(wait_until="commit", timeout=timeout)
+    await wait_ready(page, page_type, timeout, mode)
+
+
+async def after_navigation(page, action, page_type, timeout=10000, mode=None):
+    # Waiting on the old document would pass immediately, so wait for the navigation the action starts.
+    async with page.expect_navigation(wait_until="commit", timeout=timeout):
+        await action()
+    await wait_ready(page, page_type, timeout, mode)
@@ -2,6 +2,7 @@ import json
 import os
 import re
 from utils.pretty_print import display_info, display_error
+from utils.readiness import after_navigation, goto_ready
 
 TASKS_FILE = "data/tasks.json"
 
@@ -11,8 +12,7 @@ def clean_text(text: str) -> str:
 async def grab_tasks(context, url):
     try:
         page = context.pages[0]
-        await page.goto(url + f"/tasks/index")
-        await page.wait_for_load_state("networkidle")
+        await goto_ready(page, url + "/tasks/index", "tasks")
 
         panels = await page.query_selector_all("div.task_panel")
         tasks = []
@@ -66,11 +66,9 @@ async def grab_tasks(context, url):
         claim_all_form = await page.query_selector("form[action='/tasks/claim_all_rewards']")
         if claim_all_form:
             display_info("Claim All form found, submitting...")
-            await claim_all_form.evaluate("(form) => form.submit()")
-            await page.wait_for_load_state("networkidle")
+            await after_navigation(page, lambda: claim_all_form.evaluate("(form) => form.submit()"), "any")
 
-        await page.goto(url)
-        await page.wait_for_load_state("networkidle")
+        await goto_ready(page, url, "main")
 
     except Exception as e:
         display_error(f"Error grabbing tasks: {e}")
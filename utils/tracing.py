@@ -0,0 +1,184 @@
+import asyncio
+import functools
+import os
+import random
+import time
+from contextvars import ContextVar
+from data.config_settings import (
+    get_tracing_enabled,
+    get_slow_span_threshold,
+    get_trace_sample_rate,
+    get_trace_max_mb,
+)
+from utils.pretty_print import display_warning
+
+TRACE_DIR = os.path.join("data", "traces")
+
+_current = ContextVar("trace_span", default=None)
+
+
+class Span:
+    __slots__ = ("name", "attrs", "start", "duration", "error", "children")
+
+    def __init__(self, name, attrs):
+        self.name = name
+        self.attrs = attrs
+        self.start = time.perf_counter()
+        self.duration = None
+        self.error = None
+        self.children = []
+
+    def finish(self, error=None):
+        self.duration = time.perf_counter() - self.start
+        if error is not None:
+            self.error = error.__name__
+
+    def walk(self, depth=0):
+        yield depth, self
+        for child in self.children:
+            yield from child.walk(depth + 1)
+
+
+class _NoSpan:
+    async def __aenter__(self):
+        return None
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+class _SpanScope:
+    def __init__(self, name, attrs, parent):
+        self.span = Span(name, attrs)
+        self.parent = parent
+        self._token = None
+
+    async def __aenter__(self):
+        if self.parent:
+            self.parent.children.append(self.span)
+        self._token = _current.set(self.span)
+        return self.span
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.span.finish(exc_type)
+        _current.reset(self._token)
+        return False
+
+
+class TraceRecorder:
+    # Playwright tracing is per context, so only one mission per context is recorded at a time.
+    def __init__(self, directory, max_bytes, sample_rate):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.sample_rate = sample_rate
+        self._started = set()
+        self._recording = set()
+
+    async def begin(self, context):
+        if self.sample_rate <= 0 or context in self._recording or random.random() >= self.sample_rate:
+            return False
+        try:
+            if context not in self._started:
+                await context.tracing.start(screenshots=True, snapshots=True)
+                self._started.add(context)
+            await context.tracing.start_chunk()
+        except Exception as e:
+            display_warning(f"[Trace] Could not start Playwright trace: {e}")
+            return False
+        self._recording.add(context)
+        return True
+
+    async def end(self, context, name=None):
+        try:
+            if name:
+                os.makedirs(self.directory, exist_ok=True)
+                await context.tracing.stop_chunk(path=os.path.join(self.directory, name))
+            else:
+                await context.tracing.stop_chunk()
+        except Exception as e:
+            display_warning(f"[Trace] Could not save Playwright trace: {e}")
+        finally:
+            self._recording.discard(context)
+        if name:
+            await asyncio.to_thread(self.rotate)
+
+    def rotate(self):
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(".zip"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+
+
+TRACING = get_tracing_enabled()
+SLOW_THRESHOLD = get_slow_span_threshold()
+RECORDER = TraceRecorder(TRACE_DIR, get_trace_max_mb() * 1_048_576, get_trace_sample_rate())
+
+
+def span(name, **attrs):
+    # Only records inside a mission trace; elsewhere it costs one lookup.
+    parent = _current.get() if TRACING else None
+    if parent is None:
+        return _NO_SPAN
+    return _SpanScope(name, attrs, parent)
+
+
+def traced(name):
+    def decorate(fn):
+        if not TRACING:
+            return fn
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            async with span(name):
+                return await fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def format_trace(root):
+    lines = []
+    for depth, s in root.walk():
+        flag = " SLOW" if s.duration is not None and s.duration >= SLOW_THRESHOLD else ""
+        error = f" ({s.error})" if s.error else ""
+        lines.append(f"{'  ' * depth}{s.name} {s.duration:.2f}s{flag}{error}")
+    return "\n".join(lines)
+
+
+class _MissionTrace:
+    def __init__(self, kind, mission_id, page):
+        self.scope = _SpanScope(f"{kind} mission {mission_id}", {"mission_id": mission_id}, None)
+        self.kind = kind
+        self.mission_id = mission_id
+        self.context = page.context
+        self.recording = False
+
+    async def __aenter__(self):
+        self.recording = await RECORDER.begin(self.context)
+        return await self.scope.__aenter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.scope.__aexit__(exc_type, exc, tb)
+        root = self.scope.span
+        slow = any(s.duration >= SLOW_THRESHOLD for _, s in root.walk())
+        if slow:
+            display_warning(f"[Trace] Slow {self.kind} for mission {self.mission_id}:\n{format_trace(root)}")
+        if self.recording:
+            name = f"{int(time.time())}_{self.kind}_{self.mission_id}.zip" if slow else None
+            await RECORDER.end(self.context, name)
+        return False
+
+
+def mission_trace(kind, mission_id, page):
+    if not TRACING:
+        return _NO_SPAN
+    return _MissionTrace(kind, mission_id, page)
@@ -1,9 +1,117 @@
+import asyncio
+import time
+from data.config_settings import get_transport_tabs
+from utils.actions import perform_action
+from utils.metrics import METRICS, timed
 from utils.pretty_print import display_info, display_error
+from utils.readiness import goto_ready
 
+# Marks the nearest hospital or prison button so it can be clicked through Playwright,
+# which waits for the navigation the click starts.
+CHOOSE_TRANSPORT_SCRIPT = """
+() => {
+    const nearest = (options) => {
+        let best = null;
+        for (const option of options) {
+            if (!Number.isNaN(option.distance) && (!best || option.distance < best.distance)) {
+                best = option;
+            }
+        }
+        return best;
+    };
+    const mark = (option, kind) => {
+        option.button.setAttribute("data-transport-choice", "1");
+        return { kind, label: option.label, distance: option.distance };
+    };
+    if (document.querySelector("table#own-hospitals")) {
+        const options = [];
+        for (const row of document.querySelectorAll("table#own-hospitals tbody tr")) {
+            const name = row.querySelector("td:first-child");
+            const dist = row.querySelector("td:nth-child(2)");
+            const button = row.querySelector("a.btn.btn-success");
+            if (name && dist && button) {
+                options.push({ button, label: name.innerText.trim(), distance: parseFloat(dist.innerText.trim()) });
+            }
+        }
+        const best = nearest(options);
+        return best ? mark(best, "hospital") : { kind: "hospital" };
+    }
+    const options = [];
+    for (const button of document.querySelectorAll("a.btn.btn-success")) {
+        const text = button.innerText;
+        if (text.includes("Distance:")) {
+            options.push({ button, label: text.trim(), distance: parseFloat(text.split("Distance:")[1].trim()) });
+        }
+    }
+    const best = nearest(options);
+    if (best) {
+        return mark(best, "prison");
+    }
+    const release = document.querySelector("a.btn.btn-xs.btn-danger");
+    if (release) {
+        release.setAttribute("data-transport-choice", "1");
+        return { kind: "release" };
+    }
+    return { kind: "none" };
+}
+"""
+
+_TABS = {}
+
+async def open_transport_tabs(context, count):
+    tabs = [page for page in _TABS.get(context, []) if not page.is_closed()]
+    while len(tabs) < count:
+        tabs.append(await context.new_page())
+    _TABS[context] = tabs
+    return tabs[:count]
+
+async def handle_transport(page, vehicle_url):
+    await goto_ready(page, vehicle_url, "vehicle")
+    choice = await page.evaluate(CHOOSE_TRANSPORT_SCRIPT)
+    kind = choice["kind"]
+    if kind == "none":
+        display_error("No prison transport or release option found")
+        return None
+    if kind == "hospital" and "label" not in choice:
+        display_error("No valid hospital transport option found")
+        return None
+    button = await page.query_selector("[data-transport-choice]")
+    await perform_action(page, button, "Transport")
+    if kind == "hospital":
+        return f"Transported patient to hospital '{choice['label']}' ({choice['distance']} km)"
+    if kind == "prison":
+        return f"Transported prisoners to '{choice['label']}' ({choice['distance']} km)"
+    return "Released prisoners (no transport available)"
+
+async def transport_worker(page, queue, latencies):
+    # Returns how many transports this worker left unhandled (skipped or failed).
+    unhandled = 0
+    while True:
+        vehicle_url = await queue.get()
+        if vehicle_url is None:
+            queue.task_done()
+            return unhandled
+        start = time.perf_counter()
+        try:
+            message = await handle_transport(page, vehicle_url)
+            if message:
+                display_info(f"{message} in {time.perf_counter() - start:.2f}s")
+            else:
+                unhandled += 1
+            METRICS.inc("transports_total", result="done" if message else "skipped")
+        except Exception as e:
+            unhandled += 1
+            METRICS.inc("transports_total", result="failed")
+            display_error(f"Transport handling failed for {vehicle_url}: {e}")
+        finally:
+            latencies.append(time.perf_counter() - start)
+            METRICS.observe("transport_seconds", latencies[-1])
+            queue.task_done()
+
+@timed("handle_transport_requests")
 async def handle_transport_requests(context, url):
     page = context.pages[0]
-    await page.goto(url)
-    await page.wait_for_load_state("networkidle")
+    await goto_ready(page, url, "main")
     prisoner_alerts = await page.query_selector_all("div.alert.alert-danger")
     prisoner_missions = set()
     for alert in prisoner_alerts:
@@ -27,72 +135,23 @@ async def handle_transport_requests(context, url):
             if vehicle_id:
                 vehicle_urls.append(url + f"/vehicles/{vehicle_id}")
 
-    for vehicle_url in vehicle_urls:
-        try:
-            await page.goto(vehicle_url)
-            await page.wait_for_load_state("networkidle")
-
-            hospitals_table = await page.query_selector("table#own-hospitals")
-
-            if hospitals_table:
-                hospitals = await page.query_selector_all("table#own-hospitals tbody tr")
-                chosen = None
-                smallest_distance = float("inf")
-
-                for hospital in hospitals:
-                    name_el = await hospital.query_selector("td:first-child")
-                    dist_el = await hospital.query_selector("td:nth-child(2)")
-                    btn = await hospital.query_selector("a.btn.btn-success")
-                    if not (name_el and dist_el and btn):
-                        continue
-                    try:
-                        distance = float((await dist_el.inner_text()).split()[0])
-                    except:
-                        continue
-                    if distance < smallest_distance:
-                        smallest_distance = distance
-                        chosen = (btn, await name_el.inner_text(), distance)
-
-                if chosen:
-                    btn, name, distance = chosen
-                    await btn.click()
-                    await page.wait_for_load_state("networkidle")
-                    display_info(f"Transported patient to hospital '{name.strip()}' ({distance} km)")
-                else:
-                    display_error("No valid hospital transport option found")
-
-            else:
-                buttons = await page.query_selector_all("a.btn.btn-success")
-                chosen = None
-                smallest_distance = float("inf")
-
-                for btn in buttons:
-                    text = await btn.inner_text()
-                    if "Distance:" not in text:
-                        continue
-                    try:
-                        distance = float(text.split("Distance:")[1].split()[0])
-                    except:
-                        continue
-                    if distance < smallest_distance:
-                        smallest_distance = distance
-                        chosen = (btn, text.strip(), distance)
-
-                if chosen:
-                    btn, label, distance = chosen
-                    await btn.click()
-                    await page.wait_for_load_state("networkidle")
-                    display_info(f"Transported prisoners to '{label}' ({distance} km)")
-                else:
-                    release = await page.query_selector("a.btn.btn-xs.btn-danger")
-                    if release:
-                        await release.click()
-                        await page.wait_for_load_state("networkidle")
-                        display_info("Released prisoners (no transport available)")
-                    else:
-                        display_error("No prison transport or release option found")
-
-        except Exception as e:
-            display_error(f"Transport handling failed for {vehicle_url}: {e}")
+    METRICS.set("pending_transports", len(vehicle_urls))
+    unhandled = 0
+    if vehicle_urls:
+        tabs = await open_transport_tabs(context, max(1, min(get_transport_tabs(), len(vehicle_urls))))
+        queue = asyncio.Queue()
+        for vehicle_url in vehicle_urls:
+            queue.put_nowait(vehicle_url)
+        for _ in tabs:
+            queue.put_nowait(None)
+        latencies = []
+        start = time.perf_counter()
+        unhandled = sum(await asyncio.gather(*[transport_worker(tab, queue, latencies) for tab in tabs]))
+        elapsed = time.perf_counter() - start
+        display_info(
+            f"Handled {len(latencies)} transports in {elapsed:.1f}s across {len(tabs)} tabs "
+            f"(avg {sum(latencies) / len(latencies):.2f}s, max {max(latencies):.2f}s per transport)"
+        )
 
     display_info("Finished handling all transport requests")
+    return unhandled
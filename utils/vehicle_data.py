@@ -1,6 +1,93 @@
 import asyncio
 import json
-from utils.pretty_print import display_info, display_error
+import os
+from data.config_settings import get_vehicle_roster_source
+from utils.pretty_print import display_info, display_error, display_debug
+from utils.readiness import goto_ready
+
+VEHICLE_FILE = "data/vehicle_data.json"
+ROSTER_FILE = "data/vehicle_roster.json"
+TYPE_NAMES_FILE = "data/vehicle_type_names.json"
+
+
+async def read_dispatch_center_ids(page, url):
+    await goto_ready(page, url + "leitstellenansicht", "dispatch_center", timeout=30000)
+
+    vehicle_links = await page.query_selector_all('.list-group a[href^="/vehicles/"]')
+    vehicle_ids = [await link.get_attribute("href") for link in vehicle_links]
+    return [href.split("/")[-1] for href in vehicle_ids if href]
+
+
+async def fetch_vehicle_listing(context, url):
+    response = await context.request.get(url + "api/vehicles")
+    if not response.ok:
+        raise RuntimeError(f"Vehicle listing request failed with status {response.status}")
+    listing = await response.json()
+    if not isinstance(listing, list):
+        raise RuntimeError("Vehicle listing was not a list")
+    return listing
+
+
+def load_type_names():
+    if not os.path.exists(TYPE_NAMES_FILE):
+        return {}
+    try:
+        with open(TYPE_NAMES_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def save_json(path, data, indent=None):
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=indent)
+    os.replace(tmp, path)
+
+
+def roster_from_listing(listing):
+    roster = {}
+    by_type = {}
+    for vehicle in listing:
+        vid = str(vehicle["id"])
+        type_id = vehicle.get("vehicle_type")
+        type_id = str(type_id) if type_id is not None else None
+        roster[vid] = {
+            "type_id": type_id,
+            "type": None,
+            "station": vehicle.get("building_id"),
+            "status": vehicle.get("fms_real"),
+        }
+        by_type.setdefault(type_id, []).append(vid)
+    return roster, by_type
+
+
+async def collect_bulk_roster(contexts, threads, url):
+    listing = await fetch_vehicle_listing(contexts[0], url)
+    roster, by_type = roster_from_listing(listing)
+
+    # One vehicle page per unseen type id is enough to learn its display name.
+    type_names = load_type_names()
+    samples = [ids[0] for type_id, ids in by_type.items() if type_id and type_id not in type_names]
+    if samples:
+        display_info(f"Learning names of {len(samples)} vehicle types.")
+        learned = await split_vehicle_ids_among_threads(samples, contexts, threads, url)
+        for vehicle_type, ids in learned.items():
+            for vid in ids:
+                type_names[roster[vid]["type_id"]] = vehicle_type
+        save_json(TYPE_NAMES_FILE, type_names)
+
+    vehicle_data = {}
+    unresolved = []
+    for type_id, ids in by_type.items():
+        name = type_names.get(type_id) if type_id else None
+        if not name:
+            unresolved.extend(ids)
+            continue
+        vehicle_data.setdefault(name, []).extend(ids)
+        for vid in ids:
+            roster[vid]["type"] = name
+    return vehicle_data, roster, unresolved
 
 
 async def gather_vehicle_data(contexts, num_threads, url):
@@ -12,39 +99,52 @@ async def gather_vehicle_data(contexts, num_threads, url):
         await contexts[0].new_page()
 
     try:
-        page = contexts[0].pages[0]
-        await page.goto(url + "leitstellenansicht", wait_until="domcontentloaded")
-        await page.wait_for_selector(".list-group")
-
-        vehicle_links = await page.query_selector_all('.list-group a[href^="/vehicles/"]')
-        vehicle_ids = [await link.get_attribute("href") for link in vehicle_links]
-        vehicle_ids = [href.split("/")[-1] for href in vehicle_ids if href]
-
-        display_info(f"Found {len(vehicle_ids)} vehicle IDs.")
-
         threads = min(num_threads, len(contexts)) if num_threads else len(contexts)
-        vehicle_data = await split_vehicle_ids_among_threads(vehicle_ids, contexts, threads, url)
-
-        with open("data/vehicle_data.json", "w") as outfile:
+        vehicle_data = None
+        roster = None
+        if get_vehicle_roster_source() == "api":
+            try:
+                vehicle_data, roster, unresolved = await collect_bulk_roster(contexts, threads, url)
+                display_info(f"Resolved {len(roster) - len(unresolved)} vehicles from the vehicle listing.")
+                if unresolved:
+                    display_info(f"Crawling {len(unresolved)} vehicles with unknown types.")
+                    crawled = await split_vehicle_ids_among_threads(unresolved, contexts, threads, url)
+                    merge_vehicle_data(vehicle_data, crawled)
+                    for vehicle_type, ids in crawled.items():
+                        for vid in ids:
+                            roster[vid]["type"] = vehicle_type
+            except Exception as e:
+                display_error(f"Bulk vehicle roster failed, falling back to per-vehicle crawl: {e}")
+                vehicle_data = None
+                roster = None
+
+        if vehicle_data is None:
+            vehicle_ids = await read_dispatch_center_ids(contexts[0].pages[0], url)
+            display_info(f"Found {len(vehicle_ids)} vehicle IDs.")
+            vehicle_data = await split_vehicle_ids_among_threads(vehicle_ids, contexts, threads, url)
+
+        with open(VEHICLE_FILE, "w") as outfile:
             json.dump(vehicle_data, outfile, indent=4)
+        if roster is not None:
+            save_json(ROSTER_FILE, roster)
 
         display_info("Vehicle data collection complete. Stored vehicle data in vehicle_data.json.")
     except Exception as e:
         display_error(f"Error gathering vehicle data: {e}")
 
 
-async def gather_vehicle_info(vehicle_ids, context, thread_id, url):
+async def gather_vehicle_info(vehicle_ids, context, thread_id, url, page=None):
     vehicle_data = {}
 
-    if not context.pages:
-        await context.new_page()
-    page = context.pages[0]
+    if page is None:
+        if not context.pages:
+            await context.new_page()
+        page = context.pages[0]
 
     for index, vehicle_id in enumerate(vehicle_ids):
         try:
-            display_info(f"Thread {thread_id}: Grabbing vehicles {index + 1}/{len(vehicle_ids)}")
-            await page.goto(url + f"vehicles/{vehicle_id}", wait_until="domcontentloaded")
-            await page.wait_for_selector("#vehicle-attr-type a", timeout=5000)
+            display_debug(f"Thread {thread_id}: Grabbing vehicles {index + 1}/{len(vehicle_ids)}")
+            await goto_ready(page, url + f"vehicles/{vehicle_id}", "vehicle", timeout=5000)
             vehicle_type_element = await page.query_selector("#vehicle-attr-type a")
             if not vehicle_type_element:
                 continue
@@ -74,9 +174,14 @@ async def split_vehicle_ids_among_threads(vehicle_ids, contexts, num_threads, ur
 
     merged = {}
     for result in results:
-        for vehicle_type, ids in result.items():
-            if vehicle_type not in merged:
-                merged[vehicle_type] = []
-            merged[vehicle_type].extend(ids)
+        merge_vehicle_data(merged, result)
 
     return merged
+
+
+def merge_vehicle_data(target, source):
+    for vehicle_type, ids in source.items():
+        if vehicle_type not in target:
+            target[vehicle_type] = []
+        target[vehicle_type].extend(ids)
+    return target
@@ -0,0 +1,103 @@
+import asyncio
+from data.cache import get_vehicle_data, set_vehicle_data
+from data.config_settings import get_vehicle_refresh_interval
+from utils.pretty_print import display_info, display_error
+from utils.vehicle_data import (
+    VEHICLE_FILE,
+    ROSTER_FILE,
+    TYPE_NAMES_FILE,
+    fetch_vehicle_listing,
+    gather_vehicle_info,
+    load_type_names,
+    read_dispatch_center_ids,
+    roster_from_listing,
+    save_json,
+)
+
+# A listing this much smaller than the known fleet is treated as a failed read, not a sold-off fleet.
+MIN_LISTED_SHARE = 0.5
+
+
+async def list_current_vehicles(context, page, url):
+    try:
+        listing = await fetch_vehicle_listing(context, url)
+        roster, _ = roster_from_listing(listing)
+        return {vid: entry["type_id"] for vid, entry in roster.items()}, roster
+    except Exception as e:
+        display_error(f"Vehicle listing unavailable for refresh, reading dispatch center: {e}")
+        ids = await read_dispatch_center_ids(page, url)
+        return {vid: None for vid in ids}, None
+
+
+async def refresh_vehicle_data(context, page, url):
+    current = get_vehicle_data()
+    if not current:
+        return False
+    known = {vid: vehicle_type for vehicle_type, ids in current.items() for vid in ids}
+    listed, roster = await list_current_vehicles(context, page, url)
+    if len(listed) < len(known) * MIN_LISTED_SHARE:
+        display_error(f"Vehicle refresh skipped: listing returned {len(listed)} of {len(known)} known vehicles")
+        return False
+
+    new_ids = [vid for vid in listed if vid not in known]
+    removed = set(known) - set(listed)
+    if not new_ids and not removed:
+        return False
+
+    type_names = load_type_names()
+    added = {}
+    to_crawl = []
+    for vid in new_ids:
+        name = type_names.get(listed[vid]) if listed[vid] else None
+        if name:
+            added[vid] = name
+        else:
+            to_crawl.append(vid)
+    if to_crawl:
+        crawled = await gather_vehicle_info(to_crawl, context, "Refresh", url, page=page)
+        learned = False
+        for vehicle_type, ids in crawled.items():
+            for vid in ids:
+                added[vid] = vehicle_type
+                if listed[vid] and listed[vid] not in type_names:
+                    type_names[listed[vid]] = vehicle_type
+                    learned = True
+        if learned:
+            save_json(TYPE_NAMES_FILE, type_names)
+
+    refreshed = {}
+    for vehicle_type, ids in current.items():
+        kept = [vid for vid in ids if vid not in removed]
+        if kept:
+            refreshed[vehicle_type] = kept
+    for vid, vehicle_type in added.items():
+        refreshed.setdefault(vehicle_type, []).append(vid)
+    if not refreshed:
+        display_error("Vehicle refresh skipped: refreshed fleet would be empty")
+        return False
+
+    # Build the new index before publishing it so dispatch never sees a half-updated fleet.
+    set_vehicle_data(refreshed)
+    save_json(VEHICLE_FILE, refreshed, indent=4)
+    if roster is not None:
+        for vid, entry in roster.items():
+            entry["type"] = added.get(vid) or known.get(vid)
+        save_json(ROSTER_FILE, roster)
+
+    display_info(f"Vehicle roster refreshed: {len(added)} added, {len(removed)} removed, "
+                 f"{len(new_ids) - len(added)} unresolved.")
+    return True
+
+
+async def vehicle_refresh_logic(context, url):
+    interval = get_vehicle_refresh_interval()
+    if interval <= 0:
+        return
+    display_info(f"Starting vehicle roster refresh every {interval}s.")
+    page = await context.new_page()
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh_vehicle_data(context, page, url)
+        except Exception as e:
+            display_error(f"Error refreshing vehicle roster: {e}")